@@ -18,7 +18,7 @@ def main():
     
     # 1. Configurar componentes
     builder = ModelBuilder(output_dir="models")
-    engine = AnalysisEngine()
+    engine = AnalysisEngine(verbose=True)
     
     # 2. Parámetros del modelo
     L_B_ratio = 1.5   # Relación largo/ancho
@@ -21,7 +21,7 @@ def main():
     
     # Configurar componentes
     builder = ModelBuilder(output_dir="models")
-    engine = AnalysisEngine()
+    engine = AnalysisEngine(verbose=True)
     
     # Parámetros del modelo base
     L_B_ratio = 2.0
@@ -8,6 +8,8 @@ la influencia de diferentes parámetros geométricos en el comportamiento estruc
 Caso de uso: Investigación paramétrica de edificios de hormigón armado
 """
 
+import sys
+
 from src.model_builder import ModelBuilder
 from src.analysis_engine import AnalysisEngine
 from src.parametric_runner import ParametricRunner
@@ -43,18 +45,19 @@ def main():
     print(f"   ✅ Completado: {len(results_LB)} modelos analizados")
     
     # Mostrar tendencias en relación L/B
-    print("   📊 Tendencias observadas:")
+    lines = ["   📊 Tendencias observadas:\n"]
     for result in results_LB:
         params = result['model_parameters']
         LB = params['L_B_ratio']
         
         if 'static_analysis' in result['results'] and result['results']['static_analysis']['success']:
             disp = result['results']['static_analysis']['max_displacement']
-            print(f"      L/B = {LB:.1f}: Despl. máx = {disp:.6f} m")
+            lines.append(f"      L/B = {LB:.1f}: Despl. máx = {disp:.6f} m\n")
         
         if 'modal_analysis' in result['results'] and result['results']['modal_analysis']['success']:
             period = result['results']['modal_analysis']['fundamental_period']
-            print(f"      L/B = {LB:.1f}: Periodo = {period:.4f} s")
+            lines.append(f"      L/B = {LB:.1f}: Periodo = {period:.4f} s\n")
+    sys.stdout.write(''.join(lines))
     
     # === ESTUDIO 2: Sensibilidad al tamaño (B) ===
     print("\n2️⃣ ESTUDIO DE SENSIBILIDAD - Tamaño del edificio (B)")
@@ -73,7 +76,7 @@ def main():
     print(f"   ✅ Completado: {len(results_B)} modelos analizados")
     
     # Mostrar tendencias en tamaño B
-    print("   📊 Tendencias observadas:")
+    lines = ["   📊 Tendencias observadas:\n"]
     for result in results_B:
         params = result['model_parameters']
         B = params['B']
@@ -81,7 +84,8 @@ def main():
         if 'modal_analysis' in result['results'] and result['results']['modal_analysis']['success']:
             period = result['results']['modal_analysis']['fundamental_period']
             freq = result['results']['modal_analysis']['fundamental_frequency']
-            print(f"      B = {B:.1f}m: T₁ = {period:.4f} s, f₁ = {freq:.2f} Hz")
+            lines.append(f"      B = {B:.1f}m: T₁ = {period:.4f} s, f₁ = {freq:.2f} Hz\n")
+    sys.stdout.write(''.join(lines))
     
     # === ESTUDIO 3: Sensibilidad a la discretización ===
     print("\n3️⃣ ESTUDIO DE SENSIBILIDAD - Discretización (nx, ny)")
@@ -100,7 +104,7 @@ def main():
     print(f"   ✅ Completado: {len(results_mesh)} modelos analizados")
     
     # Mostrar influencia de la discretización
-    print("   📊 Tendencias observadas:")
+    lines = ["   📊 Tendencias observadas:\n"]
     for result in results_mesh:
         params = result['model_parameters']
         nx = params['nx']
@@ -108,7 +112,8 @@ def main():
         
         if 'static_analysis' in result['results'] and result['results']['static_analysis']['success']:
             disp = result['results']['static_analysis']['max_displacement']
-            print(f"      {nx}x{ny} ejes: Despl. máx = {disp:.6f} m")
+            lines.append(f"      {nx}x{ny} ejes: Despl. máx = {disp:.6f} m\n")
+    sys.stdout.write(''.join(lines))
     
     # === ESTUDIO 4: Estudio factorial completo (muestra pequeña) ===
     print("\n4️⃣ ESTUDIO FACTORIAL - Muestra representativa")
@@ -3,13 +3,36 @@
 Script para facilitar la creación de releases del paquete opensees-parametric-analysis
 """
 
+import os
+import re
 import subprocess
 import sys
 import argparse
 from pathlib import Path
 
-def run_command(cmd, check=True):
-    """Ejecuta un comando y retorna el resultado"""
+# Patrones de la línea de versión de cada archivo (se sustituye solo el valor)
+VERSION_RE = re.compile(r'^(version\s*=\s*")[^"]+(")', re.M)
+INIT_RE = re.compile(r'^(__version__\s*=\s*")[^"]+(")', re.M)
+
+# Archivos que contienen la versión y el patrón de su línea de versión
+VERSION_FILES = [
+    ("pyproject.toml", VERSION_RE),
+    ("src/__init__.py", INIT_RE)
+]
+
+def run_shell(cmd, check=True):
+    """Ejecuta un comando mostrando su salida en la terminal a medida que se produce"""
+    print(f"🔧 Ejecutando: {cmd}")
+    result = subprocess.run(cmd, shell=True, text=True)
+    
+    if check and result.returncode != 0:
+        print(f"❌ Error ejecutando: {cmd}")
+        sys.exit(1)
+    
+    return result
+
+def capture_shell(cmd, check=True):
+    """Ejecuta un comando y retorna el resultado con la salida capturada"""
     print(f"🔧 Ejecutando: {cmd}")
     result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
     
@@ -23,7 +46,7 @@ def run_command(cmd, check=True):
 
 def check_git_status():
     """Verifica que el repositorio esté limpio"""
-    result = run_command("git status --porcelain", check=False)
+    result = capture_shell("git status --porcelain", check=False)
     if result.stdout.strip():
         print("❌ Hay cambios sin commitear. Por favor, haz commit primero.")
         sys.exit(1)
@@ -31,43 +54,60 @@ def check_git_status():
 
 def update_version(version, dry_run=False):
     """Actualiza la versión en los archivos necesarios"""
-    files_to_update = [
-        ("pyproject.toml", f'version = "{version}"'),
-        ("src/__init__.py", f'__version__ = "{version}"')
-    ]
-    
-    for file_path, version_line in files_to_update:
+    for file_path, pattern in VERSION_FILES:
+        path = Path(file_path)
+        text = path.read_text(encoding="utf-8")
+        new_text, count = pattern.subn(rf'\g<1>{version}\g<2>', text, count=1)
+        if count == 0:
+            print(f"❌ No se encontró la línea de versión en {file_path}")
+            sys.exit(1)
+        
         if dry_run:
-            print(f"🔍 [DRY RUN] Actualizaría {file_path} con: {version_line}")
-        else:
+            print(f"🔍 [DRY RUN] Actualizaría {file_path} a la versión {version}")
+        elif new_text != text:
             print(f"📝 Actualizando {file_path}")
-            # Aquí implementarías la lógica real de actualización
-            # Por simplicidad, solo mostramos lo que haría
+            # Escritura atómica: archivo temporal y reemplazo en un solo paso
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(new_text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        else:
+            print(f"✅ {file_path} ya está en la versión {version}")
+
+def commit_version(version):
+    """Hace commit solo de los archivos de versión para que el tag apunte a ellos"""
+    paths = " ".join(file_path for file_path, _ in VERSION_FILES)
+    result = capture_shell(f"git status --porcelain -- {paths}", check=False)
+    if not result.stdout.strip():
+        print(f"✅ La versión {version} ya estaba commiteada")
+        return
+    print(f"📝 Haciendo commit de la versión {version}...")
+    run_shell(f"git commit -m 'Release {version}' -- {paths}")
+    print("✅ Versión commiteada")
 
 def run_tests():
     """Ejecuta la suite de tests"""
     print("🧪 Ejecutando tests...")
-    run_command("python -m pytest tests/ -v")
+    run_shell("python -m pytest tests/ -v")
     print("✅ Tests pasaron correctamente")
 
 def build_package():
     """Construye el paquete"""
     print("📦 Construyendo paquete...")
-    run_command("python -m build")
+    run_shell("python -m build")
     print("✅ Paquete construido")
 
 def create_git_tag(version):
     """Crea el tag de git"""
     tag = f"v{version}"
     print(f"🏷️  Creando tag {tag}...")
-    run_command(f"git tag -a {tag} -m 'Release {version}'")
+    run_shell(f"git tag -a {tag} -m 'Release {version}'")
     print(f"✅ Tag {tag} creado")
 
 def push_release(version):
     """Hace push del tag para triggear el release"""
     tag = f"v{version}"
     print(f"🚀 Haciendo push del tag {tag}...")
-    run_command(f"git push origin {tag}")
+    run_shell(f"git push origin {tag}")
     print("✅ Tag pushed. GitHub Actions se encargará del resto.")
 
 def main():
@@ -75,6 +115,8 @@ def main():
     parser.add_argument("version", help="Versión a released (ej: 1.0.1)")
     parser.add_argument("--dry-run", action="store_true", help="Solo mostrar lo que haría")
     parser.add_argument("--skip-tests", action="store_true", help="Saltar ejecución de tests")
+    parser.add_argument("--commit", action="store_true",
+                        help="Hacer commit de los archivos de versión antes de crear el tag")
     
     args = parser.parse_args()
     
@@ -89,6 +131,11 @@ def main():
     update_version(args.version, args.dry_run)
     
     if not args.dry_run:
+        if args.commit:
+            commit_version(args.version)
+        else:
+            print("⚠️  Los archivos de versión no se commitean (usa --commit): "
+                  "el tag apuntará al HEAD actual")
         build_package()
         create_git_tag(args.version)
         
@@ -97,6 +144,8 @@ def main():
             push_release(args.version)
         else:
             print("⏸️  Release preparado pero no publicado. Ejecuta manualmente:")
+            if args.commit:
+                print("   git push origin HEAD")
             print(f"   git push origin v{args.version}")
     
     print("🎉 ¡Release completado!")
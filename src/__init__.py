@@ -10,12 +10,32 @@ __author__ = "GJoe2"
 __email__ = "tu-email@ejemplo.com"
 __license__ = "Apache 2.0"
 
-# Importaciones principales para facilitar el uso
-from .model_builder import ModelBuilder
-from .analysis_engine import AnalysisEngine
-from .parametric_runner import ParametricRunner
-from .python_exporter import PythonExporter
-from .report_generator import ReportGenerator
+# Las clases principales se importan bajo demanda (PEP 562): importar el
+# paquete no carga openseespy, pandas ni las librerías de gráficos hasta que
+# se accede a la clase que las necesita.
+_LAZY_IMPORTS = {
+    "ModelBuilder": ".model_builder",
+    "AnalysisEngine": ".analysis_engine",
+    "ParametricRunner": ".parametric_runner",
+    "PythonExporter": ".python_exporter",
+    "ReportGenerator": ".report_generator",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     "ModelBuilder",
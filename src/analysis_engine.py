@@ -1,13 +1,108 @@
 import os
+import copy
 import json
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import openseespy.opensees as ops
 import pandas as pd
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .utils.analysis_types import StaticAnalysis, ModalAnalysis, DynamicAnalysis
 from .utils.visualization_helper import VisualizationHelper
 
+logger = logging.getLogger(__name__)
+
+
+def _enable_verbose_logging():
+    """Muestra por consola los mensajes informativos del paquete."""
+    package_logger = logging.getLogger(__package__ or __name__)
+    if not package_logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        package_logger.addHandler(handler)
+    package_logger.setLevel(logging.INFO)
+
+
+# Motor de análisis propio de cada proceso de trabajo (ver analyze_many)
+_worker_engine = None
+
+# Firma estructural del modelo que hay en el dominio de OpenSees. El dominio es
+# único por proceso, así que la firma también: cuando cualquier motor limpia o
+# reconstruye el dominio, deja de coincidir para todos los demás.
+_domain_signature = None
+
+# Por la misma razón, la construcción y los análisis de todos los motores del
+# proceso se serializan con un único lock
+_opensees_lock = threading.RLock()
+
+
+def _init_worker(engine_kwargs: Dict):
+    """Crea el motor de análisis de un proceso de trabajo."""
+    global _worker_engine
+    _worker_engine = AnalysisEngine(**engine_kwargs)
+
+
+def _analyze_in_worker(model_file: str) -> Tuple[str, Optional[Dict], Optional[str]]:
+    """Analiza un modelo en un proceso de trabajo sin propagar excepciones."""
+    try:
+        return model_file, _worker_engine.analyze_model(model_file), None
+    except Exception as e:
+        return model_file, None, str(e)
+
+
+def write_json(file_path: str, data, default: Optional[Callable] = None):
+    """
+    Escribe datos en un archivo JSON con sangría de 2 espacios.
+    
+    Usa orjson si está disponible y json en caso contrario, con el mismo
+    criterio para los tipos no nativos: se convierten con default (p. ej. str)
+    y, sin default, producen TypeError igual que json.dump.
+    
+    Args:
+        file_path: Ruta del archivo a escribir
+        data: Datos a serializar
+        default: Función para serializar tipos no nativos (opcional)
+    """
+    if orjson is not None:
+        # PASSTHROUGH_DATETIME: las fechas pasan por default, como en json
+        option = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                  orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME)
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, default=default, option=option))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2, default=default)
+
+
+@lru_cache(maxsize=None)
+def _rect_section_properties(w: float, h: float) -> Tuple[float, float, float, float]:
+    """
+    Calcula las propiedades geométricas de una sección rectangular.
+    
+    Args:
+        w: Ancho de la sección
+        h: Altura de la sección
+        
+    Returns:
+        Tupla (A, Iz, Iy, J); J con la aproximación de Timoshenko
+    """
+    A = w * h
+    Iz = w * h**3 / 12
+    Iy = h * w**3 / 12
+    a, b = (w, h) if w >= h else (h, w)
+    J = a * b**3 * (1/3 - 0.21 * (b/a) * (1 - (b**4)/(12*a**4)))
+    return A, Iz, Iy, J
+
 
 class AnalysisEngine:
     """
@@ -15,16 +110,53 @@ class AnalysisEngine:
     Separa claramente análisis numérico de visualización.
     """
     
-    def __init__(self, models_dir: str = "models", results_dir: str = "results"):
+    # Claves del modelo que definen el dominio (nodos, elementos, secciones...).
+    # Las cargas y la configuración de análisis no forman parte de la firma.
+    STRUCTURE_KEYS = ('parameters', 'nodes', 'base_node_tags', 'elements', 'sections',
+                      'transformations')
+    
+    # Número máximo de modelos con datos de construcción preparados en memoria
+    BUILD_CACHE_SIZE = 8
+    
+    # Número máximo de resultados de análisis memorizados
+    RESULTS_CACHE_SIZE = 32
+    
+    # Prefijo del nombre por defecto del archivo agregado de resultados cuando
+    # no se guardan por modelo (ver _save_batch_results)
+    BATCH_RESULTS_PREFIX = "sweep"
+    
+    def __init__(self, models_dir: str = "models", results_dir: str = "results",
+                 reuse_domain: bool = True, cache_results: bool = False,
+                 verbose: bool = False, save_individual: bool = True):
         """
         Inicializa el motor de análisis.
         
         Args:
             models_dir: Directorio donde están los modelos
             results_dir: Directorio donde se guardarán los resultados
+            reuse_domain: Si reutilizar el dominio de OpenSees cuando el modelo
+                          a construir tiene la misma estructura que el anterior;
+                          también activa la memoria de datos de construcción, que
+                          usa la misma firma estructural
+            cache_results: Si devolver los resultados memorizados cuando se vuelve
+                           a analizar un modelo con contenido idéntico (desactivado
+                           por defecto: calcular la firma tiene un costo que solo
+                           compensa si se repiten modelos)
+            verbose: Si mostrar por consola el progreso de cada análisis
+            save_individual: Si guardar un archivo de resultados por modelo; si es
+                             False, el análisis de varios modelos escribe un único
+                             archivo agregado al final
         """
         self.models_dir = models_dir
         self.results_dir = results_dir
+        self.reuse_domain = reuse_domain
+        self._build_cache = OrderedDict()
+        self.cache_results = cache_results
+        self._results_cache = OrderedDict()
+        self.verbose = verbose
+        self.save_individual = save_individual
+        if verbose:
+            _enable_verbose_logging()
         self.ensure_results_dir()
     
     def ensure_results_dir(self):
@@ -33,31 +165,54 @@ class AnalysisEngine:
             os.makedirs(self.results_dir)
     
     def load_model_from_file(self, model_file: str) -> Dict:
-        """Carga un modelo desde archivo JSON."""
+        """
+        Carga un modelo desde archivo JSON.
+        
+        No se memoriza nada: el sistema operativo ya mantiene los archivos en su
+        caché de páginas (ver _prefetch_model_files), así que leerlos de nuevo
+        es despreciable frente al parseo. Cada llamada devuelve un diccionario
+        propio que el llamador puede modificar libremente.
+        """
+        if orjson is not None:
+            with open(model_file, 'rb') as f:
+                return orjson.loads(f.read())
         with open(model_file, 'r') as f:
-            model_data = json.load(f)
-        return model_data
+            return json.load(f)
+    
+    def build_model_in_opensees(self, model_data: Dict, force_rebuild: bool = False):
+        """
+        Construye el modelo en OpenSees desde los datos cargados.
+        
+        Si la estructura del modelo (nodos, elementos, secciones, transformaciones
+        y parámetros) coincide con la del último modelo construido en este proceso,
+        por este o por otro motor, se reutiliza el dominio existente y solo se
+        redefinen el patrón de carga y las cargas.
+        
+        Args:
+            model_data: Datos del modelo
+            force_rebuild: Si reconstruir el dominio aunque la estructura coincida
+        """
+        with _opensees_lock:
+            self._build_model_in_opensees(model_data, force_rebuild)
     
-    def build_model_in_opensees(self, model_data: Dict):
-        """Construye el modelo en OpenSees desde los datos cargados."""
+    def _build_model_in_opensees(self, model_data: Dict, force_rebuild: bool):
+        """Construye el modelo; se ejecuta con el lock de OpenSees tomado."""
+        global _domain_signature
         try:
-            # Limpiar modelo anterior
-            ops.wipe()
-            ops.model('basic', '-ndm', 3, '-ndf', 6)
-            
-            # Crear nodos
-            for node_tag, node_info in model_data['nodes'].items():
-                x, y, z = node_info['coords']
-                ops.node(int(node_tag), x, y, z)
-            
-            # Crear materiales y secciones
-            self._create_sections_and_transforms(model_data)
+            # La firma solo se calcula si se va a usar para reutilizar el dominio
+            model_hash = self._structure_signature(model_data) if self.reuse_domain else None
+            reuse = (model_hash is not None and not force_rebuild
+                     and model_hash == _domain_signature)
             
-            # Crear elementos
-            self._create_elements(model_data)
-            
-            # Aplicar condiciones de frontera
-            self._apply_boundary_conditions(model_data)
+            if not (reuse and self._reset_domain(model_data)):
+                # Limpiar modelo anterior
+                _domain_signature = None
+                ops.wipe()
+                ops.model('basic', '-ndm', 3, '-ndf', 6)
+                
+                build_data = self._get_build_data(model_data, model_hash)
+                self._build_domain(build_data)
+                _domain_signature = model_hash
             
             # Definir patrón de carga
             ops.timeSeries('Linear', 1)
@@ -67,15 +222,98 @@ class AnalysisEngine:
             self._apply_loads(model_data)
                     
         except Exception as e:
-            print(f"Error construyendo modelo en OpenSees: {str(e)}")
+            _domain_signature = None
+            logger.error("Error construyendo modelo en OpenSees: %s", e)
             raise
     
-    def analyze_model(self, model_file: str) -> Dict:
+    def _structure_signature(self, model_data: Dict) -> str:
+        """Calcula una firma de la parte estructural del modelo."""
+        return self._signature({key: model_data.get(key) for key in self.STRUCTURE_KEYS})
+    
+    @staticmethod
+    def _signature(data: Dict) -> str:
+        """Calcula una firma estable del contenido de un diccionario."""
+        if orjson is not None:
+            option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            payload = orjson.dumps(data, default=str, option=option)
+        else:
+            payload = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha1(payload).hexdigest()
+    
+    def _get_build_data(self, model_data: Dict, model_hash: Optional[str]) -> Dict:
+        """
+        Obtiene los datos de construcción preparados para un modelo.
+        
+        Los datos se memorizan por firma estructural, de modo que un modelo
+        cuyo contenido no ha cambiado no se vuelve a convertir; cualquier
+        cambio en la estructura produce una firma nueva y se recalculan. Sin
+        firma (reuse_domain=False) se preparan siempre.
+        """
+        if model_hash is None:
+            return self._prepare_build_data(model_data)
+        
+        build_data = self._build_cache.get(model_hash)
+        if build_data is not None:
+            self._build_cache.move_to_end(model_hash)
+            return build_data
+        
+        build_data = self._prepare_build_data(model_data)
+        self._build_cache[model_hash] = build_data
+        if len(self._build_cache) > self.BUILD_CACHE_SIZE:
+            self._build_cache.popitem(last=False)
+        return build_data
+    
+    def _prepare_build_data(self, model_data: Dict) -> Dict:
+        """Convierte la parte estructural del modelo a argumentos listos para OpenSees."""
+        slab_args, frame_args = self._element_args(model_data)
+        return {
+            'node_args': self._node_args(model_data),
+            'base_node_tags': self._base_node_tags(model_data),
+            'section_args': self._section_args(model_data),
+            'transf_args': self._transf_args(model_data),
+            'slab_args': slab_args,
+            'frame_args': frame_args,
+        }
+    
+    def _reset_domain(self, model_data: Dict) -> bool:
+        """
+        Devuelve el dominio actual a su estado inicial sin reconstruirlo.
+        
+        La firma solo registra lo que construyó el motor: si el dominio se limpió
+        por fuera (ops.wipe() en un notebook, un script exportado, opstool...)
+        la firma sigue coincidiendo, así que antes de reutilizarlo se comprueba
+        que el dominio vivo tenga los nodos y elementos del modelo.
+        
+        Args:
+            model_data: Datos del modelo a construir
+        
+        Returns:
+            True si el dominio se pudo reutilizar, False si hay que reconstruirlo
+        """
+        try:
+            if (len(ops.getNodeTags()) != len(model_data['nodes'])
+                    or len(ops.getEleTags()) != len(model_data['elements'])):
+                return False
+            ops.wipeAnalysis()
+            ops.remove('loadPattern', 1)
+            ops.remove('timeSeries', 1)
+            ops.reset()
+            ops.setTime(0.0)
+            return True
+        except Exception:
+            return False
+    
+    def analyze_model(self, model_file: str, force_rebuild: bool = False) -> Dict:
         """
         Analiza un modelo completo según su configuración.
         
+        Si el mismo contenido de modelo ya se analizó con este motor, se
+        devuelven los resultados memorizados sin volver a ejecutar OpenSees.
+        
         Args:
             model_file: Ruta al archivo del modelo
+            force_rebuild: Si ignorar los resultados memorizados y reconstruir
+                           el dominio de OpenSees desde cero
             
         Returns:
             Diccionario con todos los resultados
@@ -91,34 +329,68 @@ class AnalysisEngine:
         analysis_config = model_data['analysis_config']
         enabled_analyses = analysis_config.get('enabled_analyses', ['static', 'modal'])
         
-        print(f"Analizando modelo: {model_name}")
-        print(f"Análisis habilitados: {enabled_analyses}")
+        results_key = None
+        if self.cache_results:
+            results_key = self._signature(model_data)
+            cached = None if force_rebuild else self._results_cache.get(results_key)
+            if cached is not None:
+                self._results_cache.move_to_end(results_key)
+                # Se devuelve una copia con fecha actual y se guarda igual que
+                # un análisis nuevo
+                analysis_results = copy.deepcopy(cached)
+                analysis_results['timestamp'] = pd.Timestamp.now().isoformat()
+                if self.save_individual:
+                    self._save_results(analysis_results, model_name)
+                return analysis_results
+        
+        logger.info("Analizando modelo: %s", model_name)
+        logger.info("Análisis habilitados: %s", enabled_analyses)
 
-        # Construir modelo en OpenSees
-        self.build_model_in_opensees(model_data)
+        with _opensees_lock:
+            # Construir modelo en OpenSees
+            self.build_model_in_opensees(model_data, force_rebuild=force_rebuild)
 
-        # Configurar helper de visualización si es necesario
-        viz_helper = self._setup_visualization_helper(analysis_config)
+            # Configurar helper de visualización si es necesario
+            viz_helper = self._setup_visualization_helper(analysis_config)
 
-        # Ejecutar análisis según configuración
-        results = self._run_analyses(model_data, enabled_analyses, viz_helper)
-        
-        # Construir y guardar resultados finales
-        analysis_results = self._build_final_results(model_data, results)
-        self._save_results(analysis_results, model_name)
+            # Ejecutar análisis según configuración
+            results = self._run_analyses(model_data, enabled_analyses, viz_helper)
+            
+            # Construir y guardar resultados finales
+            analysis_results = self._build_final_results(model_data, results)
+            if self.save_individual:
+                self._save_results(analysis_results, model_name)
+            
+            # Generar visualizaciones si están habilitadas
+            self._generate_visualizations(model_data, analysis_results, viz_helper)
         
-        # Generar visualizaciones si están habilitadas
-        self._generate_visualizations(model_data, analysis_results, viz_helper)
+        if results_key is not None:
+            self._results_cache[results_key] = copy.deepcopy(analysis_results)
+            if len(self._results_cache) > self.RESULTS_CACHE_SIZE:
+                self._results_cache.popitem(last=False)
         
         return analysis_results
     
     def _setup_visualization_helper(self, analysis_config: Dict) -> Optional[VisualizationHelper]:
-        """Configura helper de visualización si es necesario."""
+        """
+        Configura helper de visualización si los análisis lo necesitan.
+        
+        Solo se crea antes de analizar cuando alguna visualización registra
+        respuestas durante el análisis (deformada estática o formas modales).
+        En otro caso se crea después, en _generate_visualizations, y solo si
+        algún análisis terminó con éxito.
+        """
         viz_config = analysis_config.get('visualization', {})
         
         if not viz_config.get('enabled', False):
             return None
+        if not (viz_config.get('static_deformed', False) or viz_config.get('modal_shapes', False)):
+            return None
             
+        return self._create_visualization_helper()
+    
+    def _create_visualization_helper(self) -> VisualizationHelper:
+        """Crea el helper de visualización del motor."""
         return VisualizationHelper(results_dir=self.results_dir, odb_tag=1)
     
     def _run_analyses(self, model_data: Dict, enabled_analyses: List[str], 
@@ -159,20 +431,28 @@ class AnalysisEngine:
             'timestamp': pd.Timestamp.now().isoformat()
         }
     
-    def _save_results(self, analysis_results: Dict, model_name: str):
+    def _save_results(self, analysis_results: Union[Dict, List[Dict]], model_name: str):
         """Guarda los resultados en archivo JSON."""
         results_file = os.path.join(self.results_dir, f"{model_name}_results.json")
-        with open(results_file, 'w') as f:
-            json.dump(analysis_results, f, indent=2, default=str)
+        # Fechas y tipos no nativos se serializan con str()
+        write_json(results_file, analysis_results, default=str)
     
     def _generate_visualizations(self, model_data: Dict, analysis_results: Dict, 
                                viz_helper: Optional[VisualizationHelper]):
         """Genera visualizaciones si están habilitadas."""
-        if viz_helper is None:
-            print("   ⏭️  Visualización deshabilitada")
+        viz_config = model_data['analysis_config'].get('visualization', {})
+        if not viz_config.get('enabled', False):
+            logger.info("   ⏭️  Visualización deshabilitada")
             return
         
-        viz_config = model_data['analysis_config'].get('visualization', {})
+        if viz_helper is None:
+            # El helper se crea recién aquí, y solo si hay algo que visualizar
+            if not any(analysis_results.get(key, {}).get('success', False)
+                       for key in ('static_analysis', 'modal_analysis', 'dynamic_analysis')):
+                logger.info("   ⏭️  Ningún análisis exitoso: no se generan visualizaciones")
+                return
+            viz_helper = self._create_visualization_helper()
+        
         model_name = model_data['name']
         generated_files = []
         
@@ -194,76 +474,155 @@ class AnalysisEngine:
         
         # Agregar archivos a resultados
         analysis_results['visualization_files'] = generated_files
-        print(f"   📋 Total de archivos de visualización: {len(generated_files)}")
+        logger.info("   📋 Total de archivos de visualización: %d", len(generated_files))
         
         # Limpiar recursos
         viz_helper.cleanup()
     
     # --- Métodos de construcción del modelo (sin cambios significativos) ---
     
-    def _create_sections_and_transforms(self, model_data: Dict):
-        """Crea secciones y transformaciones geométricas."""
+    @staticmethod
+    def _node_args(model_data: Dict) -> List[Tuple[int, float, float, float]]:
+        """Convierte los nodos a tuplas (tag, x, y, z) listas para ops.node."""
+        return [(int(tag), *info['coords']) for tag, info in model_data['nodes'].items()]
+    
+    @staticmethod
+    def _base_node_tags(model_data: Dict) -> Tuple[int, ...]:
+        """
+        Obtiene los tags de los nodos de la base (piso 0).
+        
+        Usa la lista guardada en el modelo si existe; los modelos anteriores que
+        no la incluyen se recorren nodo a nodo.
+        """
+        base_node_tags = model_data.get('base_node_tags')
+        if base_node_tags is not None:
+            return tuple(int(tag) for tag in base_node_tags)
+        return tuple(int(tag) for tag, info in model_data['nodes'].items() if info['floor'] == 0)
+    
+    @staticmethod
+    def _section_args(model_data: Dict) -> List[tuple]:
+        """
+        Prepara los argumentos de ops.section para todas las secciones.
+        
+        Las constantes del material y las propiedades geométricas se resuelven
+        aquí una sola vez, de modo que la creación es una llamada por sección.
+        """
         params = model_data['parameters']
-        E = params['E']
-        nu = params['nu']
+        E, nu, rho = params['E'], params['nu'], params['rho']
         G = E / (2 * (1 + nu))
-
-        # Crear secciones
+        
+        section_args = []
         for sec_tag, sec_info in model_data['sections'].items():
-            tag = int(sec_tag)
-            if sec_info['type'] == 'ElasticMembranePlateSection':
-                thickness = sec_info['thickness']
-                rho = params['rho']
-                ops.section('ElasticMembranePlateSection', tag, E, nu, thickness, rho)
-            
-            elif sec_info['type'] == 'Elastic':
-                size = sec_info['size']
-                w, h = size[0], size[1]
-                A = w * h
-                Iz = w * h**3 / 12
-                Iy = h * w**3 / 12
-                a, b = max(w, h), min(w, h)
-                J = a * b**3 * (1/3 - 0.21 * (b/a) * (1 - (b**4)/(12*a**4)))
-                ops.section('Elastic', tag, E, A, Iz, Iy, G, J)
-
-        # Crear transformaciones geométricas
-        for transf_tag, transf_info in model_data['transformations'].items():
-            tag = int(transf_tag)
-            if transf_info['type'] == 'Linear':
-                vecxz = transf_info['vecxz']
-                ops.geomTransf('Linear', tag, *vecxz)
-    
-    def _create_elements(self, model_data: Dict):
-        """Crea elementos del modelo."""
+            sec_type = sec_info['type']
+            if sec_type == 'ElasticMembranePlateSection':
+                section_args.append((sec_type, int(sec_tag), E, nu, sec_info['thickness'], rho))
+            elif sec_type == 'Elastic':
+                A, Iz, Iy, J = _rect_section_properties(*sec_info['size'])
+                section_args.append((sec_type, int(sec_tag), E, A, Iz, Iy, G, J))
+        return section_args
+    
+    @staticmethod
+    def _transf_args(model_data: Dict) -> List[tuple]:
+        """Prepara los argumentos de ops.geomTransf para todas las transformaciones."""
+        return [('Linear', int(transf_tag), *transf_info['vecxz'])
+                for transf_tag, transf_info in model_data['transformations'].items()
+                if transf_info['type'] == 'Linear']
+    
+    @staticmethod
+    def _element_args(model_data: Dict) -> Tuple[List[tuple], List[tuple]]:
+        """
+        Prepara los argumentos de ops.element separados por tipo de elemento.
+        
+        Returns:
+            Tupla (slab_args, frame_args): losas como (tag, n1, n2, n3, n4, sec_tag)
+            y columnas/vigas como (tag, n1, n2, sec_tag, transf_tag), con la
+            transformación ya resuelta desde la sección
+        """
+        transf_tags = {int(sec_tag): int(sec_info['transf_tag'])
+                       for sec_tag, sec_info in model_data['sections'].items()
+                       if 'transf_tag' in sec_info}
+        
+        slab_args = []
+        frame_args = []
         for elem_tag, elem_info in model_data['elements'].items():
-            nodes = [int(n) for n in elem_info['nodes']]
             elem_type = elem_info['type']
-            
             if elem_type == 'slab':
-                section_tag = elem_info['section_tag']
-                ops.element('ShellMITC4', int(elem_tag), *nodes, section_tag)
-            elif elem_type in ['column', 'beam_x', 'beam_y']:
-                section_tag = elem_info['section_tag']
-                section_info = model_data['sections'][str(section_tag)]
-                transf_tag = section_info['transf_tag']
-                ops.element('elasticBeamColumn', int(elem_tag), *nodes, int(section_tag), int(transf_tag))
-    
-    def _apply_boundary_conditions(self, model_data: Dict):
-        """Aplica condiciones de frontera."""
-        for node_tag, node_info in model_data['nodes'].items():
-            if node_info['floor'] == 0:  # Nodos de la base
-                ops.fix(int(node_tag), 1, 1, 1, 1, 1, 1)
+                section_tag = int(elem_info['section_tag'])
+                slab_args.append((int(elem_tag), *map(int, elem_info['nodes']), section_tag))
+            elif elem_type in {'column', 'beam_x', 'beam_y'}:
+                section_tag = int(elem_info['section_tag'])
+                frame_args.append((int(elem_tag), *map(int, elem_info['nodes']),
+                                   section_tag, transf_tags[section_tag]))
+        return slab_args, frame_args
+    
+    def _build_domain(self, build_data: Dict):
+        """
+        Crea nodos, secciones, transformaciones, elementos y apoyos.
+        
+        Todo el recorrido se hace en una sola función con las funciones de
+        OpenSees enlazadas a variables locales, sobre los argumentos ya
+        preparados en build_data.
+        
+        Args:
+            build_data: Datos de construcción preparados (ver _prepare_build_data)
+        """
+        node = ops.node
+        section = ops.section
+        geom_transf = ops.geomTransf
+        element = ops.element
+        fix = ops.fix
+        
+        # Nodos
+        for args in build_data['node_args']:
+            node(*args)
+        
+        # Secciones y transformaciones geométricas
+        for args in build_data['section_args']:
+            section(*args)
+        for args in build_data['transf_args']:
+            geom_transf(*args)
+        
+        # Elementos: losas y luego columnas/vigas
+        for args in build_data['slab_args']:
+            element('ShellMITC4', *args)
+        for args in build_data['frame_args']:
+            element('elasticBeamColumn', *args)
+        
+        # Condiciones de frontera (empotramiento en los nodos de la base)
+        for tag in build_data['base_node_tags']:
+            fix(tag, 1, 1, 1, 1, 1, 1)
+    
+    @staticmethod
+    def _vertical_load_args(model_data: Dict) -> List[Tuple[int, float]]:
+        """Obtiene las cargas verticales como tuplas (node_tag, valor)."""
+        return [(int(node_tag), float(load_info['value']))
+                for node_tag, load_info in model_data['loads'].items()
+                if load_info['direction'] == 'Z']
     
     def _apply_loads(self, model_data: Dict):
         """Aplica cargas al modelo."""
-        for node_tag, load_info in model_data['loads'].items():
-            if load_info['direction'] == 'Z':
-                ops.load(int(node_tag), 0.0, 0.0, float(load_info['value']), 0.0, 0.0, 0.0)
+        load = ops.load
+        for node_tag, value in self._vertical_load_args(model_data):
+            load(node_tag, 0.0, 0.0, value, 0.0, 0.0, 0.0)
     
     # --- Métodos de conveniencia ---
     
-    def analyze_multiple_models(self, model_files: List[str]) -> List[Dict]:
-        """Analiza múltiples modelos."""
+    def analyze_multiple_models(self, model_files: List[str], n_workers: Optional[int] = 1,
+                                batch_name: Optional[str] = None) -> List[Dict]:
+        """
+        Analiza múltiples modelos.
+        
+        Args:
+            model_files: Rutas a los archivos de los modelos
+            n_workers: Número de procesos; 1 analiza en este proceso y None usa
+                       todas las CPUs (ver analyze_many)
+            batch_name: Nombre del archivo agregado de resultados cuando
+                        save_individual=False (ver _save_batch_results)
+        """
+        if n_workers != 1:
+            return self.analyze_many(model_files, n_workers, batch_name)
+        
+        self._prefetch_model_files(model_files)
         results = []
         
         for model_file in tqdm(model_files, desc="Analizando modelos"):
@@ -271,15 +630,111 @@ class AnalysisEngine:
                 result = self.analyze_model(model_file)
                 results.append(result)
             except Exception as e:
-                print(f"Error analizando {model_file}: {e}")
+                logger.error("Error analizando %s: %s", model_file, e)
         
+        self._save_batch_results(results, batch_name)
         return results
     
+    def analyze_many(self, model_files: List[str], n_workers: Optional[int] = None,
+                     batch_name: Optional[str] = None) -> List[Dict]:
+        """
+        Analiza múltiples modelos en paralelo con un pool de procesos.
+        
+        OpenSees mantiene un único dominio global por proceso, por lo que cada
+        proceso de trabajo tiene su propio motor de análisis. A cada tarea solo se
+        le envía la ruta del modelo.
+        
+        Args:
+            model_files: Rutas a los archivos de los modelos
+            n_workers: Número de procesos (por defecto, el número de CPUs)
+            batch_name: Nombre del archivo agregado de resultados cuando
+                        save_individual=False (ver _save_batch_results)
+            
+        Returns:
+            Lista con los resultados de los modelos analizados correctamente,
+            en el mismo orden que model_files
+        """
+        if n_workers == 1 or len(model_files) <= 1:
+            return self.analyze_multiple_models(model_files, batch_name=batch_name)
+        
+        engine_kwargs = {
+            'models_dir': self.models_dir,
+            'results_dir': self.results_dir,
+            'reuse_domain': self.reuse_domain,
+            'cache_results': self.cache_results,
+            'verbose': self.verbose,
+            'save_individual': self.save_individual,
+        }
+        
+        # No crear más procesos que modelos
+        n_workers = min(n_workers or os.cpu_count() or 1, len(model_files))
+        self._prefetch_model_files(model_files)
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(engine_kwargs,)) as executor:
+            outcomes = executor.map(_analyze_in_worker, model_files)
+            for model_file, result, error in tqdm(outcomes, total=len(model_files),
+                                                  desc="Analizando modelos"):
+                if error is not None:
+                    logger.error("Error analizando %s: %s", model_file, error)
+                else:
+                    results.append(result)
+        
+        self._save_batch_results(results, batch_name)
+        return results
+    
+    def _save_batch_results(self, results: List[Dict], batch_name: Optional[str] = None):
+        """
+        Guarda en un solo archivo los resultados de varios modelos.
+        
+        Solo actúa cuando no se guardan archivos por modelo (save_individual=False);
+        el archivo contiene la lista de resultados y ReportGenerator lo lee igual
+        que los archivos individuales. Se escribe en <batch_name>_batch_results.json,
+        un nombre que no coincide con el de los resultados de ningún modelo; sin
+        batch_name se usa BATCH_RESULTS_PREFIX con la fecha y hora, de modo que
+        cada lote escribe su propio archivo.
+        
+        Args:
+            results: Resultados de los modelos del lote
+            batch_name: Nombre del lote (opcional)
+        """
+        if self.save_individual or not results:
+            return
+        if batch_name is None:
+            timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M%S_%f')
+            batch_name = f"{self.BATCH_RESULTS_PREFIX}_{timestamp}"
+        self._save_results(results, f"{batch_name}_batch")
+        logger.info("Resultados del lote guardados: %s_batch_results.json", batch_name)
+    
+    @staticmethod
+    def _prefetch_model_files(model_files: List[str]):
+        """
+        Pide al sistema operativo que lea por adelantado los archivos de modelo.
+        
+        Es solo una indicación (posix_fadvise WILLNEED): el kernel carga los
+        archivos en la caché de páginas en segundo plano mientras se analizan
+        los primeros modelos. En plataformas sin posix_fadvise no hace nada.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        
+        for model_file in model_files:
+            try:
+                fd = os.open(model_file, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+    
     def get_model_files(self) -> List[str]:
         """Obtiene lista de archivos de modelos en el directorio."""
-        model_files = []
-        if os.path.exists(self.models_dir):
-            for file in os.listdir(self.models_dir):
-                if file.endswith('.json'):
-                    model_files.append(os.path.join(self.models_dir, file))
-        return model_files
+        if not os.path.exists(self.models_dir):
+            return []
+        with os.scandir(self.models_dir) as entries:
+            return [entry.path for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()]
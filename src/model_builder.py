@@ -1,7 +1,195 @@
 import os
 import json
-from typing import Dict, List, Tuple
-import numpy as np
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Propiedades del hormigón (f'c = 210 kgf/cm²), calculadas una sola vez
+_CONCRETE_E = 15000 * 210**0.5 * 0.001 / 0.01**2  # Módulo de elasticidad en tonf/m²
+_CONCRETE_RHO = (2.4 * 1.0 / 1.0**3) / 9.81       # Densidad en tonf·s²/m⁴
+
+# Transformaciones geométricas: no dependen de los parámetros del modelo.
+# create_model copia cada entrada, de modo que ningún modelo modifica la plantilla.
+_TRANSFORMATIONS = {
+    '4': {'type': 'Linear', 'vecxz': (0, 1, 0)}, # Para columnas
+    '5': {'type': 'Linear', 'vecxz': (0, 0, 1)}  # Para vigas
+}
+
+
+@lru_cache(maxsize=32)
+def _section_definitions(slab_thickness: float, column_size: Tuple[float, float],
+                         beam_size: Tuple[float, float]) -> Dict:
+    """
+    Define las secciones de losa, columna y viga.
+    
+    Los modelos de un barrido comparten casi siempre las mismas dimensiones,
+    de modo que reutilizan el resultado memorizado. El resultado es una
+    plantilla compartida: create_model copia cada sección antes de usarla.
+    
+    Args:
+        slab_thickness: Espesor de la losa
+        column_size: Dimensiones (b, h) de las columnas
+        beam_size: Dimensiones (b, h) de las vigas
+        
+    Returns:
+        Diccionario {tag: datos de la sección}
+    """
+    return {
+        '1': { # Losa
+            'type': 'ElasticMembranePlateSection',
+            'thickness': slab_thickness
+        },
+        '2': { # Columna
+            'type': 'Elastic',
+            'element_type': 'column',
+            'size': column_size,
+            'transf_tag': 4  # Tag de la transformación geométrica para columnas
+        },
+        '3': { # Viga
+            'type': 'Elastic',
+            'element_type': 'beam',
+            'size': beam_size,
+            'transf_tag': 5  # Tag de la transformación geométrica para vigas
+        }
+    }
+
+
+# Configuración por defecto de visualización y de cada análisis. create_model
+# toma de analysis_params solo estas claves y usa el valor por defecto del resto.
+_ANALYSIS_DEFAULTS = {
+    'visualization': {
+        'enabled': False,           # Por defecto NO visualizar
+        'static_deformed': False,   # Deformada estática
+        'modal_shapes': False,      # Formas modales
+        'deform_scale': 100,        # Factor de escala
+        'save_html': True,          # Guardar como HTML
+        'show_nodes': True,         # Mostrar nodos
+        'line_width': 2             # Grosor de líneas
+    },
+    'static': {
+        'system': 'BandGeneral',
+        'numberer': 'RCM',
+        'constraints': 'Plain',
+        'integrator': 'LoadControl',
+        'algorithm': 'Linear',
+        'analysis': 'Static',
+        'steps': 10
+    },
+    'modal': {
+        'system': 'BandGeneral',
+        'numberer': 'RCM',
+        'constraints': 'Plain',
+        'integrator': 'LoadControl',
+        'algorithm': 'Linear',
+        'analysis': 'Static',
+        'num_modes': 6
+    },
+    'dynamic': {
+        'system': 'BandGeneral',
+        'numberer': 'RCM',
+        'constraints': 'Plain',
+        'integrator': 'Newmark',
+        'algorithm': 'Newton',
+        'analysis': 'Transient',
+        'dt': 0.01,
+        'num_steps': 1000
+    }
+}
+
+
+# Constructor de cada proceso de trabajo (ver ModelBuilder.create_many)
+_worker_builder = None
+
+
+def _init_worker(output_dir: str, fixed_params: Dict):
+    """Crea el constructor de modelos de un proceso de trabajo."""
+    global _worker_builder
+    _worker_builder = ModelBuilder(output_dir=output_dir)
+    _worker_builder.fixed_params = fixed_params
+
+
+def _create_in_worker(params: Dict) -> Tuple[Dict, Optional[Dict], Optional[str]]:
+    """Crea un modelo en un proceso de trabajo sin propagar excepciones."""
+    try:
+        return params, _worker_builder.create_model(**params), None
+    except Exception as e:
+        return params, None, str(e)
+
+
+@lru_cache(maxsize=32)
+def _element_connectivity(nx: int, ny: int, num_floors: int) -> Tuple[Tuple, ...]:
+    """
+    Genera los elementos (losas, columnas y vigas) de una grilla nx x ny.
+    
+    La conectividad en planta (losas y vigas) se calcula una sola vez
+    relativa al primer nodo de un piso y luego se desplaza piso a piso.
+    Los tags se asignan en orden: losas, columnas, y vigas X/Y por piso.
+    
+    Solo depende de la topología de la grilla, de modo que modelos que
+    difieren en dimensiones o materiales comparten el mismo resultado
+    memorizado. Por eso se devuelven tuplas inmutables: cada modelo construye
+    sus propios diccionarios de elementos a partir de ellas.
+    
+    Args:
+        nx: Número de ejes en dirección X
+        ny: Número de ejes en dirección Y
+        num_floors: Número de pisos
+        
+    Returns:
+        Tupla de elementos (tipo, nodos, piso, section_tag) en orden de tag
+    """
+    stride = nx + 1
+    nodes_per_floor = stride * (ny + 1)
+    
+    # Conectividad en planta relativa al nodo base del piso
+    slab_quads = [(j * stride + i + 1, j * stride + i + 2,
+                   (j + 1) * stride + i + 2, (j + 1) * stride + i + 1)
+                  for j in range(ny) for i in range(nx)]
+    beam_x_pairs = [(j * stride + i + 1, j * stride + i + 2)
+                    for j in range(ny + 1) for i in range(nx)]
+    beam_y_pairs = [(j * stride + i + 1, (j + 1) * stride + i + 1)
+                    for j in range(ny) for i in range(nx + 1)]
+    
+    elements = []
+    
+    # Crear elementos de losa (ShellMITC4) en cada nivel de piso (excepto la base)
+    # El bucle inicia en 1 para crear losas en el piso 1, 2, etc.
+    for floor in range(1, num_floors + 1):
+        base_node = floor * nodes_per_floor
+        elements.extend(
+            ('slab', (base_node + n1, base_node + n2, base_node + n3, base_node + n4), floor, 1)
+            for n1, n2, n3, n4 in slab_quads)
+    
+    # Crear elementos de columna (elasticBeamColumn), eje por eje y de abajo hacia arriba
+    elements.extend(
+        ('column', (floor * nodes_per_floor + k, (floor + 1) * nodes_per_floor + k), floor, 2)
+        for k in range(1, nodes_per_floor + 1) for floor in range(num_floors))
+    
+    # Crear elementos de viga (elasticBeamColumn) en cada nivel de piso (excepto la base)
+    # El bucle inicia en 1 para crear vigas en el piso 1, 2, etc.
+    for floor in range(1, num_floors + 1):
+        base_node = floor * nodes_per_floor
+        
+        # Vigas en dirección X
+        elements.extend(
+            ('beam_x', (base_node + n1, base_node + n2), floor, 3)
+            for n1, n2 in beam_x_pairs)
+        
+        # Vigas en dirección Y
+        elements.extend(
+            ('beam_y', (base_node + n1, base_node + n2), floor, 3)
+            for n1, n2 in beam_y_pairs)
+    
+    return tuple(elements)
+
 
 class ModelBuilder:
     """
@@ -9,12 +197,13 @@ class ModelBuilder:
     Genera archivos de modelos OpenSees para diferentes combinaciones de parámetros.
     """
     
-    def __init__(self, output_dir: str = "models"):
+    def __init__(self, output_dir: Union[str, Dict[str, bytes]] = "models"):
         """
         Inicializa el constructor de modelos.
         
         Args:
-            output_dir: Directorio donde se guardarán los modelos
+            output_dir: Directorio donde se guardarán los modelos, o un diccionario
+                        {nombre_archivo: bytes} para mantenerlos solo en memoria
         """
         self.output_dir = output_dir
         self.ensure_output_dir()
@@ -26,13 +215,20 @@ class ModelBuilder:
             'slab_thickness': 0.10,       # 10 cm
             'num_floors': 2,              # 2 pisos
             'floor_height': 3.0,          # 3 m por piso
-            'E': 15000 * 210**0.5 * 0.001 / 0.01**2,  # Módulo de elasticidad en tonf/m²
+            'E': _CONCRETE_E,             # Módulo de elasticidad en tonf/m²
             'nu': 0.2,                    # Coeficiente de Poisson
-            'rho': (2.4 * 1.0 / 1.0**3) / 9.81  # Densidad en tonf·s²/m⁴
+            'rho': _CONCRETE_RHO          # Densidad en tonf·s²/m⁴
         }
     
+    @property
+    def in_memory(self) -> bool:
+        """Indica si los modelos se guardan en un diccionario en memoria."""
+        return isinstance(self.output_dir, dict)
+    
     def ensure_output_dir(self):
         """Asegura que el directorio de salida existe."""
+        if self.in_memory:
+            return
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
     
@@ -49,8 +245,10 @@ class ModelBuilder:
         Returns:
             Nombre codificado del modelo (ej: F01_45_10_1224)
         """
-        # Convertir L/B ratio a formato de 2 dígitos (ej: 1.5 -> 15)
-        aspect_code = int(L_B_ratio * 10)
+        # Convertir L/B ratio a formato de 2 dígitos (ej: 1.5 -> 15, 1.75 -> 17).
+        # Se trunca como siempre, pero tras eliminar el error de punto flotante:
+        # 1.0999999999999999 (p. ej. de sumar pasos de 0.1) debe dar 11 y no 10
+        aspect_code = int(round(L_B_ratio * 10, 6))
         
         # Convertir B a formato de 2 dígitos (ej: 10.0 -> 10)
         B_code = int(B)
@@ -116,90 +314,35 @@ class ModelBuilder:
         element_data = self._create_elements(nx, ny)
         
         # Crear cargas
-        load_data = self._create_loads(node_data)
+        load_data = self._create_loads(nx, ny)
         
         # Definir secciones y transformaciones
-        sections = {
-            '1': { # Losa
-                'type': 'ElasticMembranePlateSection',
-                'thickness': self.fixed_params['slab_thickness']
-            },
-            '2': { # Columna
-                'type': 'Elastic',
-                'element_type': 'column',
-                'size': self.fixed_params['column_size'],
-                'transf_tag': 4  # Tag de la transformación geométrica para columnas
-            },
-            '3': { # Viga
-                'type': 'Elastic',
-                'element_type': 'beam',
-                'size': self.fixed_params['beam_size'],
-                'transf_tag': 5  # Tag de la transformación geométrica para vigas
-            }
-        }
-
-        transformations = {
-            '4': {'type': 'Linear', 'vecxz': [0, 1, 0]}, # Para columnas
-            '5': {'type': 'Linear', 'vecxz': [0, 0, 1]}  # Para vigas
-        }
+        # Se copian las plantillas memorizadas para que cada modelo tenga sus
+        # propios diccionarios (los valores internos son inmutables)
+        section_templates = _section_definitions(self.fixed_params['slab_thickness'],
+                                                 tuple(self.fixed_params['column_size']),
+                                                 tuple(self.fixed_params['beam_size']))
+        sections = {tag: dict(section) for tag, section in section_templates.items()}
+        transformations = {tag: dict(transf) for tag, transf in _TRANSFORMATIONS.items()}
         
         # Definir configuración de análisis dinámica basada en enabled_analyses
         analysis_config = {'enabled_analyses': enabled_analyses}
         
-        # Configuración global de visualización
-        viz_params = analysis_params.get('visualization', {})
-        analysis_config['visualization'] = {
-            'enabled': viz_params.get('enabled', False),  # Por defecto NO visualizar
-            'static_deformed': viz_params.get('static_deformed', False),  # Deformada estática
-            'modal_shapes': viz_params.get('modal_shapes', False),  # Formas modales
-            'deform_scale': viz_params.get('deform_scale', 100),  # Factor de escala
-            'save_html': viz_params.get('save_html', True),  # Guardar como HTML
-            'show_nodes': viz_params.get('show_nodes', True),  # Mostrar nodos
-            'line_width': viz_params.get('line_width', 2)  # Grosor de líneas
-        }
-        
-        # Configuración estática (si está habilitada)
-        if 'static' in enabled_analyses:
-            static_params = analysis_params.get('static', {})
-            analysis_config['static'] = {
-                'system': static_params.get('system', 'BandGeneral'),
-                'numberer': static_params.get('numberer', 'RCM'),
-                'constraints': static_params.get('constraints', 'Plain'),
-                'integrator': static_params.get('integrator', 'LoadControl'),
-                'algorithm': static_params.get('algorithm', 'Linear'),
-                'analysis': static_params.get('analysis', 'Static'),
-                'steps': static_params.get('steps', 10)
-            }
-        
-        # Configuración modal (si está habilitada)
-        if 'modal' in enabled_analyses:
-            modal_params = analysis_params.get('modal', {})
-            analysis_config['modal'] = {
-                'system': modal_params.get('system', 'BandGeneral'),
-                'numberer': modal_params.get('numberer', 'RCM'),
-                'constraints': modal_params.get('constraints', 'Plain'),
-                'integrator': modal_params.get('integrator', 'LoadControl'),
-                'algorithm': modal_params.get('algorithm', 'Linear'),
-                'analysis': modal_params.get('analysis', 'Static'),
-                'num_modes': modal_params.get('num_modes', 6)
-            }
-        
-        # Configuración dinámica (si está habilitada)
-        if 'dynamic' in enabled_analyses:
-            dynamic_params = analysis_params.get('dynamic', {})
-            analysis_config['dynamic'] = {
-                'system': dynamic_params.get('system', 'BandGeneral'),
-                'numberer': dynamic_params.get('numberer', 'RCM'),
-                'constraints': dynamic_params.get('constraints', 'Plain'),
-                'integrator': dynamic_params.get('integrator', 'Newmark'),
-                'algorithm': dynamic_params.get('algorithm', 'Newton'),
-                'analysis': dynamic_params.get('analysis', 'Transient'),
-                'dt': dynamic_params.get('dt', 0.01),
-                'num_steps': dynamic_params.get('num_steps', 1000)
-            }
+        # La visualización siempre se configura; cada análisis solo si está habilitado
+        for name, defaults in _ANALYSIS_DEFAULTS.items():
+            if name == 'visualization' or name in enabled_analyses:
+                params = analysis_params.get(name)
+                if params:
+                    analysis_config[name] = {key: params.get(key, default)
+                                             for key, default in defaults.items()}
+                else:
+                    analysis_config[name] = dict(defaults)
         
         # Guardar modelo en archivo
-        model_file = os.path.join(self.output_dir, f"{model_name}.json")
+        if self.in_memory:
+            model_file = f"{model_name}.json"
+        else:
+            model_file = os.path.join(self.output_dir, f"{model_name}.json")
         model_info = {
             'name': model_name,
             'parameters': {
@@ -213,138 +356,128 @@ class ModelBuilder:
             'sections': sections,
             'transformations': transformations,
             'nodes': node_data,
+            # Nodos de la base (piso 0): son los primeros de la numeración
+            'base_node_tags': list(range(1, (nx + 1) * (ny + 1) + 1)),
             'elements': element_data,
             'loads': load_data,
             'analysis_config': analysis_config,
             'file_path': model_file
         }
         
-        with open(model_file, 'w') as f:
-            json.dump(model_info, f, indent=2)
+        self._write_model(model_file, model_info)
         
         return model_info
     
+    def create_many(self, param_grid: List[Dict], n_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Crea varios modelos en paralelo con un pool de procesos.
+        
+        Cada combinación de parámetros es independiente, de modo que el barrido
+        se reparte entre procesos que escriben sus archivos directamente en
+        output_dir. Con un solo proceso, una sola combinación o salida en memoria
+        (el diccionario no se comparte entre procesos) los modelos se crean
+        secuencialmente.
+        
+        Args:
+            param_grid: Lista de diccionarios con los argumentos de create_model
+                        Ej: [{'L_B_ratio': 1.5, 'B': 10.0, 'nx': 4, 'ny': 3}, ...]
+            n_workers: Número de procesos (por defecto, el número de CPUs)
+            
+        Returns:
+            Lista con la información de los modelos creados correctamente,
+            en el mismo orden que param_grid
+        """
+        if n_workers == 1 or len(param_grid) <= 1 or self.in_memory:
+            return [self.create_model(**params) for params in param_grid]
+        
+        # No crear más procesos que modelos
+        n_workers = min(n_workers or os.cpu_count() or 1, len(param_grid))
+        
+        models_info = []
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(self.output_dir, self.fixed_params)) as executor:
+            for params, model_info, error in executor.map(_create_in_worker, param_grid):
+                if error is not None:
+                    logger.error("Error creando modelo %s: %s", params, error)
+                else:
+                    models_info.append(model_info)
+        
+        return models_info
+    
+    def _write_model(self, model_file: str, model_info: Dict):
+        """Escribe el modelo en disco o en el diccionario de salida."""
+        if orjson is not None:
+            # Las claves de nodos/elementos son enteros: OPT_NON_STR_KEYS las
+            # convierte a texto igual que json.dump
+            data = orjson.dumps(model_info, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(model_info, indent=2).encode('utf-8')
+        
+        if self.in_memory:
+            self.output_dir[model_file] = data
+        else:
+            with open(model_file, 'wb') as f:
+                f.write(data)
+    
     def _create_nodes(self, L: float, B: float, nx: int, ny: int) -> Dict:
-        """Crea los nodos del modelo."""
-        node_data = {}
-        node_tag = 1
+        """
+        Crea los nodos del modelo.
         
+        Las coordenadas de los ejes y de los pisos se calculan una sola vez y
+        los nodos se generan piso a piso (tag = piso * nodos_por_piso + k + 1).
+        """
         # Espaciado entre ejes
         dx = L / nx
         dy = B / ny
         dz = self.fixed_params['floor_height']
         
+        # Posiciones de la grilla en planta, recorridas en el orden de los tags
+        xs = [i * dx for i in range(nx + 1)]
+        ys = [j * dy for j in range(ny + 1)]
+        # grid_pos es una tupla (inmutable) compartida por los nodos de la misma
+        # posición en todos los pisos
+        grid = [((i, j), x, y) for j, y in enumerate(ys) for i, x in enumerate(xs)]
+        zs = [floor * dz for floor in range(self.fixed_params['num_floors'] + 1)]
+        nodes_per_floor = len(grid)
+        
         # Crear nodos para cada piso
-        for floor in range(self.fixed_params['num_floors'] + 1):
-            z = floor * dz
-            for j in range(ny + 1):
-                for i in range(nx + 1):
-                    x = i * dx
-                    y = j * dy
-                    node_data[node_tag] = {
-                        'coords': [x, y, z],
-                        'floor': floor,
-                        'grid_pos': [i, j]
-                    }
-                    node_tag += 1
-        
-        return node_data
+        return {
+            floor * nodes_per_floor + k + 1: {
+                'coords': (x, y, z),
+                'floor': floor,
+                'grid_pos': grid_pos
+            }
+            for floor, z in enumerate(zs)
+            for k, (grid_pos, x, y) in enumerate(grid)
+        }
     
     def _create_elements(self, nx: int, ny: int) -> Dict:
-        """Crea los elementos del modelo."""
-        element_data = {}
-        elem_tag = 1
-
-        # Crear elementos de losa (ShellMITC4) en cada nivel de piso (excepto la base)
-        # El bucle inicia en 1 para crear losas en el piso 1, 2, etc.
-        for floor in range(1, self.fixed_params['num_floors'] + 1):
-            base_node = floor * (nx + 1) * (ny + 1)
-            for j in range(ny):
-                for i in range(nx):
-                    # Nodos del elemento de losa
-                    n1 = base_node + j * (nx + 1) + i + 1
-                    n2 = base_node + j * (nx + 1) + i + 2
-                    n3 = base_node + (j + 1) * (nx + 1) + i + 2
-                    n4 = base_node + (j + 1) * (nx + 1) + i + 1
-                    
-                    element_data[elem_tag] = {
-                        'type': 'slab',
-                        'nodes': [n1, n2, n3, n4],
-                        'floor': floor,
-                        'section_tag': 1
-                    }
-                    elem_tag += 1
-        
-        # Crear elementos de columna (elasticBeamColumn)
-        for j in range(ny + 1):
-            for i in range(nx + 1):
-                for floor in range(self.fixed_params['num_floors']):
-                    # Nodos de la columna
-                    n1 = floor * (nx + 1) * (ny + 1) + j * (nx + 1) + i + 1
-                    n2 = (floor + 1) * (nx + 1) * (ny + 1) + j * (nx + 1) + i + 1
-                    
-                    element_data[elem_tag] = {
-                        'type': 'column',
-                        'nodes': [n1, n2],
-                        'floor': floor,
-                        'section_tag': 2
-                    }
-                    elem_tag += 1
-        
-        # Crear elementos de viga (elasticBeamColumn) en cada nivel de piso (excepto la base)
-        # El bucle inicia en 1 para crear vigas en el piso 1, 2, etc.
-        for floor in range(1, self.fixed_params['num_floors'] + 1):
-            base_node = floor * (nx + 1) * (ny + 1)
-            
-            # Vigas en dirección X
-            for j in range(ny + 1):
-                for i in range(nx):
-                    n1 = base_node + j * (nx + 1) + i + 1
-                    n2 = base_node + j * (nx + 1) + i + 2
-                    
-                    element_data[elem_tag] = {
-                        'type': 'beam_x',
-                        'nodes': [n1, n2],
-                        'floor': floor,
-                        'section_tag': 3
-                    }
-                    elem_tag += 1
-            
-            # Vigas en dirección Y
-            for j in range(ny):
-                for i in range(nx + 1):
-                    n1 = base_node + j * (nx + 1) + i + 1
-                    n2 = base_node + (j + 1) * (nx + 1) + i + 1
-                    
-                    element_data[elem_tag] = {
-                        'type': 'beam_y',
-                        'nodes': [n1, n2],
-                        'floor': floor,
-                        'section_tag': 3
-                    }
-                    elem_tag += 1
-        
-        return element_data
+        """Crea los elementos del modelo (ver _element_connectivity)."""
+        return {
+            tag: {'type': elem_type, 'nodes': nodes, 'floor': floor, 'section_tag': section_tag}
+            for tag, (elem_type, nodes, floor, section_tag)
+            in enumerate(_element_connectivity(nx, ny, self.fixed_params['num_floors']), start=1)
+        }
     
-    def _create_loads(self, node_data: Dict) -> Dict:
-        """Crea las cargas del modelo."""
-        load_data = {}
+    def _create_loads(self, nx: int, ny: int) -> Dict:
+        """
+        Crea las cargas del modelo.
         
+        Los nodos del último piso son el último bloque de la numeración, de
+        modo que sus tags se obtienen como un rango sin recorrer los nodos.
+        """
         # Carga distribuida en losa (1 tonf/m²)
         q = 1.0  # tonf/m²
-        
-        try:
-            # Aplicar carga en nodos del último piso
-            for node_tag, node_info in node_data.items():
-                if node_info['floor'] == self.fixed_params['num_floors']:
-                    # Carga vertical en cada nodo
-                    load_data[node_tag] = {
-                        'type': 'distributed_load',
-                        'value': -q,
-                        'direction': 'Z'
-                    }
-        except Exception as e:
-            print(f"Error aplicando carga al nodo {node_tag}: {str(e)}")
-            raise
-        
-        return load_data
\ No newline at end of file
+        load_value = -q
+        
+        # Aplicar carga vertical en cada nodo del último piso
+        nodes_per_floor = (nx + 1) * (ny + 1)
+        first_tag = self.fixed_params['num_floors'] * nodes_per_floor + 1
+        return {
+            node_tag: {
+                'type': 'distributed_load',
+                'value': load_value,
+                'direction': 'Z'
+            }
+            for node_tag in range(first_tag, first_tag + nodes_per_floor)
+        }
\ No newline at end of file
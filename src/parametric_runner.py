@@ -1,13 +1,23 @@
 import os
 import random
-from typing import Dict, List
+import itertools
+from typing import Dict, List, NamedTuple
 
 from .model_builder import ModelBuilder
-from .analysis_engine import AnalysisEngine
+from .analysis_engine import AnalysisEngine, write_json
 from .report_generator import ReportGenerator
 from .python_exporter import PythonExporter
 from .utils.model_helpers import ModelBuilderHelpers
 
+
+class ModelParams(NamedTuple):
+    """Combinación de parámetros geométricos de un modelo (inmutable y hashable)."""
+    L_B_ratio: float
+    B: float
+    nx: int
+    ny: int
+
+
 class ParametricRunner:
     """
     Orquesta estudios paramétricos completos.
@@ -24,6 +34,14 @@ class ParametricRunner:
     - Separa lógica de ejecución de lógica de orquestación
     """
 
+    # Método de ModelBuilderHelpers que crea cada tipo de modelo
+    _HELPER_BY_TYPE = {
+        'static': 'create_static_only_model',
+        'modal': 'create_modal_only_model',
+        'dynamic': 'create_dynamic_model',
+        'complete': 'create_complete_model',
+    }
+
     def __init__(self, model_builder: ModelBuilder, analysis_engine: AnalysisEngine,
                  report_generator: ReportGenerator, python_exporter: PythonExporter):
         """
@@ -58,12 +76,7 @@ class ParametricRunner:
         print("--- Iniciando generación de modelos paramétricos ---")
         
         # Generar todas las combinaciones
-        all_combinations = []
-        for L_B_ratio in L_B_ratios:
-            for B in B_values:
-                for nx in nx_values:
-                    for ny in ny_values:
-                        all_combinations.append((L_B_ratio, B, nx, ny))
+        all_combinations = self._combinations(L_B_ratios, B_values, nx_values, ny_values)
         
         total_models = len(all_combinations)
         print(f"Total de combinaciones: {total_models}")
@@ -96,14 +109,7 @@ class ParametricRunner:
         for i, (L_B_ratio, B, nx, ny) in enumerate(all_combinations):
             analysis_type = analysis_types[i]
             try:
-                if analysis_type == 'static':
-                    model_info = self.helpers.create_static_only_model(L_B_ratio, B, nx, ny)
-                elif analysis_type == 'modal':
-                    model_info = self.helpers.create_modal_only_model(L_B_ratio, B, nx, ny)
-                elif analysis_type == 'dynamic':
-                    model_info = self.helpers.create_dynamic_model(L_B_ratio, B, nx, ny)
-                else:  # complete
-                    model_info = self.helpers.create_complete_model(L_B_ratio, B, nx, ny)
+                model_info = self._create_model_by_type(analysis_type, L_B_ratio, B, nx, ny)
                 
                 models_info.append(model_info)
                 print(f"{analysis_type.capitalize()} {i+1}/{total_models}: {model_info['name']}")
@@ -139,30 +145,20 @@ class ParametricRunner:
         models_info = []
         print("--- Generando modelos con criterios específicos ---")
         
-        for L_B_ratio in L_B_ratios:
-            for B in B_values:
-                for nx in nx_values:
-                    for ny in ny_values:
-                        # Determinar tipo de análisis basado en criterios
-                        analysis_type = self._determine_analysis_type(
-                            L_B_ratio, B, nx, ny, analysis_criteria
-                        )
-                        
-                        try:
-                            if analysis_type == 'static':
-                                model_info = self.helpers.create_static_only_model(L_B_ratio, B, nx, ny)
-                            elif analysis_type == 'modal':
-                                model_info = self.helpers.create_modal_only_model(L_B_ratio, B, nx, ny)
-                            elif analysis_type == 'dynamic':
-                                model_info = self.helpers.create_dynamic_model(L_B_ratio, B, nx, ny)
-                            else:  # complete
-                                model_info = self.helpers.create_complete_model(L_B_ratio, B, nx, ny)
-                            
-                            models_info.append(model_info)
-                            print(f"{analysis_type.capitalize()}: {model_info['name']}")
-                            
-                        except Exception as e:
-                            print(f"Error creando modelo: {e}")
+        for L_B_ratio, B, nx, ny in self._combinations(L_B_ratios, B_values, nx_values, ny_values):
+            # Determinar tipo de análisis basado en criterios
+            analysis_type = self._determine_analysis_type(
+                L_B_ratio, B, nx, ny, analysis_criteria
+            )
+            
+            try:
+                model_info = self._create_model_by_type(analysis_type, L_B_ratio, B, nx, ny)
+                
+                models_info.append(model_info)
+                print(f"{analysis_type.capitalize()}: {model_info['name']}")
+                
+            except Exception as e:
+                print(f"Error creando modelo: {e}")
         
         print(f"\nTotal de {len(models_info)} modelos generados con criterios.")
         return models_info
@@ -278,12 +274,7 @@ class ParametricRunner:
             }
         
         # Generar todas las combinaciones
-        all_combinations = []
-        for L_B_ratio in L_B_ratios:
-            for B in B_values:
-                for nx in nx_values:
-                    for ny in ny_values:
-                        all_combinations.append((L_B_ratio, B, nx, ny))
+        all_combinations = self._combinations(L_B_ratios, B_values, nx_values, ny_values)
         
         total_models = len(all_combinations)
         criteria_count = int(total_models * criteria_distribution.get("criteria", 0.7))
@@ -364,16 +355,18 @@ class ParametricRunner:
             'report': report
         }
     
+    @staticmethod
+    def _combinations(L_B_ratios: List[float], B_values: List[float],
+                      nx_values: List[int], ny_values: List[int]) -> List[ModelParams]:
+        """Genera el producto cartesiano de parámetros como lista de ModelParams."""
+        return [ModelParams(*combo)
+                for combo in itertools.product(L_B_ratios, B_values, nx_values, ny_values)]
+    
     def _create_model_by_type(self, analysis_type: str, L_B_ratio: float, B: float, nx: int, ny: int):
         """Método auxiliar para crear modelo según el tipo de análisis usando helpers."""
-        if analysis_type == 'static':
-            return self.helpers.create_static_only_model(L_B_ratio, B, nx, ny)
-        elif analysis_type == 'modal':
-            return self.helpers.create_modal_only_model(L_B_ratio, B, nx, ny)
-        elif analysis_type == 'dynamic':
-            return self.helpers.create_dynamic_model(L_B_ratio, B, nx, ny)
-        else:  # complete
-            return self.helpers.create_complete_model(L_B_ratio, B, nx, ny)
+        # Cualquier otro tipo se trata como análisis completo
+        helper_name = self._HELPER_BY_TYPE.get(analysis_type, 'create_complete_model')
+        return getattr(self.helpers, helper_name)(L_B_ratio, B, nx, ny)
     
     # Métodos de compatibilidad con tests existentes
     def generate_parameter_combinations(self, parameters: Dict) -> List[Dict]:
@@ -386,8 +379,6 @@ class ParametricRunner:
         Returns:
             Lista de diccionarios con combinaciones de parámetros
         """
-        import itertools
-        
         # Extraer nombres y valores de parámetros
         param_names = list(parameters.keys())
         param_values = list(parameters.values())
@@ -522,13 +513,10 @@ class ParametricRunner:
         Returns:
             Ruta del archivo guardado
         """
-        import json
-        
         file_path = f"results/{study_name}_summary.json"
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        write_json(file_path, summary)
             
         return file_path
     
@@ -1,7 +1,6 @@
 import os
 import json
 import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
 import plotly.express as px
@@ -9,6 +8,11 @@ from plotly.subplots import make_subplots
 from typing import Dict, List, Optional
 import seaborn as sns
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ReportGenerator:
     """
     Clase para generar reportes de análisis paramétrico.
@@ -46,6 +50,15 @@ class ReportGenerator:
         Returns:
             Diccionario con los resultados
         """
+        if orjson is not None:
+            with open(results_file, 'rb') as f:
+                data = f.read()
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # json.dump escribe NaN/Infinity, que orjson no acepta
+                return json.loads(data)
+        
         with open(results_file, 'r') as f:
             results = json.load(f)
         return results
@@ -64,7 +77,11 @@ class ReportGenerator:
                     file_path = os.path.join(self.results_dir, file)
                     try:
                         result = self.load_analysis_results(file_path)
-                        results.append(result)
+                        # Los archivos agregados de un barrido contienen una lista
+                        if isinstance(result, list):
+                            results.extend(result)
+                        else:
+                            results.append(result)
                     except Exception as e:
                         print(f"Error cargando {file}: {e}")
         return results
@@ -111,19 +128,22 @@ class ReportGenerator:
         
         return pd.DataFrame(summary_data)
     
-    def generate_displacement_report(self, results: List[Dict], save_plots: bool = True) -> Dict:
+    def generate_displacement_report(self, results: List[Dict], save_plots: bool = True,
+                                     df: Optional[pd.DataFrame] = None) -> Dict:
         """
         Genera reporte de desplazamientos.
         
         Args:
             results: Lista de resultados de análisis
             save_plots: Si guardar las gráficas
+            df: DataFrame resumen ya creado para results (opcional)
             
         Returns:
             Diccionario con información del reporte
         """
         # Crear DataFrame resumen
-        df = self.create_summary_dataframe(results)
+        if df is None:
+            df = self.create_summary_dataframe(results)
         
         # Filtrar solo análisis exitosos
         df_success = df[df['static_success'] == True]
@@ -223,19 +243,22 @@ class ReportGenerator:
             }
         }
     
-    def generate_modal_report(self, results: List[Dict], save_plots: bool = True) -> Dict:
+    def generate_modal_report(self, results: List[Dict], save_plots: bool = True,
+                              df: Optional[pd.DataFrame] = None) -> Dict:
         """
         Genera reporte de análisis modal.
         
         Args:
             results: Lista de resultados de análisis
             save_plots: Si guardar las gráficas
+            df: DataFrame resumen ya creado para results (opcional)
             
         Returns:
             Diccionario con información del reporte
         """
         # Crear DataFrame resumen
-        df = self.create_summary_dataframe(results)
+        if df is None:
+            df = self.create_summary_dataframe(results)
         
         # Filtrar solo análisis modales exitosos
         df_success = df[df['modal_success'] == True]
@@ -370,12 +393,15 @@ class ReportGenerator:
         """
         print("Generando reporte completo...")
         
+        # El DataFrame resumen se crea una sola vez y se comparte entre reportes
+        df = self.create_summary_dataframe(results)
+        
         # Generar reportes individuales
-        displacement_report = self.generate_displacement_report(results)
-        modal_report = self.generate_modal_report(results)
+        displacement_report = self.generate_displacement_report(results, df=df)
+        modal_report = self.generate_modal_report(results, df=df)
         
         # Crear reporte HTML completo
-        html_content = self._create_html_report(results, displacement_report, modal_report)
+        html_content = self._create_html_report(results, displacement_report, modal_report, df)
         html_file = os.path.join(self.reports_dir, 'comprehensive_report.html')
         
         with open(html_file, 'w', encoding='utf-8') as f:
@@ -383,7 +409,7 @@ class ReportGenerator:
         
         # Crear resumen ejecutivo
         summary_file = os.path.join(self.reports_dir, 'executive_summary.txt')
-        self._create_executive_summary(results, summary_file)
+        self._create_executive_summary(results, summary_file, df)
         
         return {
             'html_report': html_file,
@@ -393,9 +419,10 @@ class ReportGenerator:
         }
     
     def _create_html_report(self, results: List[Dict], displacement_report: Dict, 
-                           modal_report: Dict) -> str:
+                           modal_report: Dict, df: Optional[pd.DataFrame] = None) -> str:
         """Crea contenido HTML para el reporte completo."""
-        df = self.create_summary_dataframe(results)
+        if df is None:
+            df = self.create_summary_dataframe(results)
         
         html = f"""
         <!DOCTYPE html>
@@ -467,9 +494,11 @@ class ReportGenerator:
         
         return html
     
-    def _create_executive_summary(self, results: List[Dict], summary_file: str):
+    def _create_executive_summary(self, results: List[Dict], summary_file: str,
+                                  df: Optional[pd.DataFrame] = None):
         """Crea un resumen ejecutivo en texto plano."""
-        df = self.create_summary_dataframe(results)
+        if df is None:
+            df = self.create_summary_dataframe(results)
         
         with open(summary_file, 'w', encoding='utf-8') as f:
             f.write("RESUMEN EJECUTIVO - ANÁLISIS PARAMÉTRICO\n")
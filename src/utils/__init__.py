@@ -14,23 +14,31 @@ Autor: OpenSees Model Builder
 Fecha: Agosto 2025
 """
 
-try:
-    from .model_helpers import ModelBuilderHelpers
-    from .analysis_types import StaticAnalysis, ModalAnalysis, DynamicAnalysis
-    from .visualization_helper import VisualizationHelper
-except ImportError as e:
-    # Fallback para casos donde los imports relativos no funcionan
-    import sys
-    import os
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    sys.path.insert(0, current_dir)
-    try:
-        from model_helpers import ModelBuilderHelpers
-        from analysis_types import StaticAnalysis, ModalAnalysis, DynamicAnalysis
-        from visualization_helper import VisualizationHelper
-    except ImportError:
-        # Si aún falla, imprimir el error y continuar
-        print(f"Warning: Could not import utils modules: {e}")
+# Los módulos se importan bajo demanda (PEP 562), igual que en el paquete
+# principal: importar model_helpers no carga openseespy ni opstool.
+_LAZY_IMPORTS = {
+    'ModelBuilderHelpers': '.model_helpers',
+    'StaticAnalysis': '.analysis_types',
+    'ModalAnalysis': '.analysis_types',
+    'DynamicAnalysis': '.analysis_types',
+    'VisualizationHelper': '.visualization_helper',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
 
 __all__ = [
     'ModelBuilderHelpers',
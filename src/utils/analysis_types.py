@@ -3,11 +3,16 @@ Análisis específicos para OpenSees.
 Separa cada tipo de análisis en su propia clase para mejor mantenimiento.
 """
 
+import logging
+import math
 import openseespy.opensees as ops
-import numpy as np
 from typing import Dict, List
 from .visualization_helper import VisualizationHelper
 
+logger = logging.getLogger(__name__)
+
+_TWO_PI = 2 * math.pi
+
 
 class BaseAnalysis:
     """Clase base para todos los análisis."""
@@ -37,15 +42,18 @@ class BaseAnalysis:
         
     def get_max_displacement(self) -> float:
         """Obtiene el desplazamiento máximo del modelo."""
-        max_disp = 0.0
+        node_disp = ops.nodeDisp
         
+        # Se compara el cuadrado de la magnitud y se toma una sola raíz al final
+        max_sq = 0.0
         for node_tag, node_info in self.model_data['nodes'].items():
             if node_info['floor'] > 0:  # Solo nodos superiores a la base
-                disp = ops.nodeDisp(int(node_tag))
-                disp_magnitude = np.sqrt(disp[0]**2 + disp[1]**2 + disp[2]**2)
-                max_disp = max(max_disp, disp_magnitude)
+                ux, uy, uz = node_disp(int(node_tag))[:3]
+                sq = ux * ux + uy * uy + uz * uz
+                if sq > max_sq:
+                    max_sq = sq
         
-        return max_disp
+        return math.sqrt(max_sq)
 
 
 class StaticAnalysis(BaseAnalysis):
@@ -90,7 +98,7 @@ class StaticAnalysis(BaseAnalysis):
                     'max_displacement': max_disp,
                     'responses_available': odb_available
                 })
-                print(f"   ✅ Análisis estático completado - Desplazamiento máx: {max_disp:.6f} m")
+                logger.info("   ✅ Análisis estático completado - Desplazamiento máx: %.6f m", max_disp)
             else:
                 results.update({
                     'success': False,
@@ -99,7 +107,7 @@ class StaticAnalysis(BaseAnalysis):
                 })
                 
         except Exception as e:
-            print(f"Error en análisis estático para {self.model_name}: {e}")
+            logger.error("Error en análisis estático para %s: %s", self.model_name, e)
             results['error'] = str(e)
             
         return results
@@ -124,7 +132,7 @@ class StaticAnalysis(BaseAnalysis):
                     viz_helper.capture_response_step()
                     
             except Exception as e:
-                print(f"   ❌ Error en paso {step} del análisis: {e}")
+                logger.error("   ❌ Error en paso %d del análisis: %s", step, e)
                 return False
                 
         return True
@@ -174,11 +182,12 @@ class ModalAnalysis(BaseAnalysis):
                 'odb_available': modal_odb_available
             })
             
-            period_text = f"{periods[0]:.4f} s" if periods else "N/A"
-            print(f"   ✅ Análisis modal completado - Periodo fundamental: {period_text}")
+            if logger.isEnabledFor(logging.INFO):
+                period_text = f"{periods[0]:.4f} s" if periods else "N/A"
+                logger.info("   ✅ Análisis modal completado - Periodo fundamental: %s", period_text)
             
         except Exception as e:
-            print(f"Error en análisis modal para {self.model_name}: {e}")
+            logger.error("Error en análisis modal para %s: %s", self.model_name, e)
             results['error'] = str(e)
             
         return results
@@ -193,14 +202,10 @@ class ModalAnalysis(BaseAnalysis):
         Returns:
             Tupla con (frecuencias, periodos)
         """
-        frequencies = []
-        periods = []
-        
-        for val in eigen_values:
-            if val > 1e-6:
-                freq = np.sqrt(val) / (2 * np.pi)
-                frequencies.append(freq)
-                periods.append(1.0 / freq)
+        # Solo valores propios positivos (modos con rigidez)
+        omegas = [math.sqrt(val) for val in eigen_values if val > 1e-6]
+        frequencies = [omega / _TWO_PI for omega in omegas]
+        periods = [_TWO_PI / omega for omega in omegas]
                 
         return frequencies, periods
 
@@ -247,7 +252,7 @@ class DynamicAnalysis(BaseAnalysis):
                     'dt': dt,
                     'total_time': dt * num_steps
                 })
-                print(f"   ✅ Análisis dinámico completado - Desplazamiento máx: {max_disp:.6f} m")
+                logger.info("   ✅ Análisis dinámico completado - Desplazamiento máx: %.6f m", max_disp)
             else:
                 results.update({
                     'success': False,
@@ -255,7 +260,7 @@ class DynamicAnalysis(BaseAnalysis):
                 })
                 
         except Exception as e:
-            print(f"Error en análisis dinámico para {self.model_name}: {e}")
+            logger.error("Error en análisis dinámico para %s: %s", self.model_name, e)
             results['error'] = str(e)
             
         return results
@@ -289,5 +294,5 @@ class DynamicAnalysis(BaseAnalysis):
             return True
             
         except Exception as e:
-            print(f"   ❌ Error en análisis dinámico: {e}")
+            logger.error("   ❌ Error en análisis dinámico: %s", e)
             return False
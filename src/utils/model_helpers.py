@@ -17,16 +17,14 @@ Fecha: Agosto 2025
 """
 
 from typing import Dict
-import sys
-import os
 
-# Agregar el directorio src al path para imports absolutos
-current_dir = os.path.dirname(os.path.abspath(__file__))
-src_dir = os.path.dirname(current_dir)
-if src_dir not in sys.path:
-    sys.path.insert(0, src_dir)
-
-from model_builder import ModelBuilder
+try:
+    from ..model_builder import ModelBuilder
+except ImportError:
+    # Los notebooks agregan src/ al path e importan utils.model_helpers como
+    # paquete de primer nivel, donde no hay paquete padre para la importación
+    # relativa
+    from model_builder import ModelBuilder
 
 
 class ModelBuilderHelpers:
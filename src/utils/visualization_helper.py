@@ -6,15 +6,34 @@ Separa la lógica de visualización del motor de análisis principal.
 import os
 from typing import Dict, List, Optional
 
-try:
-    import opstool as opst
-    import opstool.vis.plotly as opsvis
-    OPSTOOL_AVAILABLE = True
-except ImportError:
-    print("Warning: opstool not available. Visualization features will be limited.")
-    OPSTOOL_AVAILABLE = False
-    opst = None
-    opsvis = None
+# opstool se importa la primera vez que se necesita (ver _ensure_opstool):
+# los análisis sin visualización no pagan el costo de importarlo.
+# OPSTOOL_AVAILABLE vale None hasta ese momento.
+OPSTOOL_AVAILABLE = None
+opst = None
+opsvis = None
+
+
+def _ensure_opstool() -> bool:
+    """
+    Importa opstool si aún no se ha intentado.
+    
+    Returns:
+        True si opstool está disponible
+    """
+    global OPSTOOL_AVAILABLE, opst, opsvis
+    if OPSTOOL_AVAILABLE is None:
+        try:
+            import opstool
+            import opstool.vis.plotly
+        except ImportError:
+            print("Warning: opstool not available. Visualization features will be limited.")
+            OPSTOOL_AVAILABLE = False
+        else:
+            opst = opstool
+            opsvis = opstool.vis.plotly
+            OPSTOOL_AVAILABLE = True
+    return OPSTOOL_AVAILABLE
 
 
 class VisualizationHelper:
@@ -42,7 +61,7 @@ class VisualizationHelper:
         Returns:
             True si se creó exitosamente, False en caso contrario
         """
-        if not OPSTOOL_AVAILABLE:
+        if not _ensure_opstool():
             return False
             
         if self._odb is not None:
@@ -101,6 +120,7 @@ class VisualizationHelper:
             True si se creó exitosamente, False en caso contrario
         """
         try:
+            _ensure_opstool()
             modal_odb = opst.post.CreateModeShapeODB(
                 odb_tag=self.odb_tag,
                 mode_tags="all"
@@ -128,6 +148,7 @@ class VisualizationHelper:
             return generated_files
             
         try:
+            _ensure_opstool()
             print(f"   📊 Creando visualización de respuesta estática...")
             export_format = viz_config.get('export_format', 'html')
             
@@ -172,6 +193,7 @@ class VisualizationHelper:
             return generated_files
             
         try:
+            _ensure_opstool()
             print(f"   📊 Creando visualizaciones de formas modales...")
             export_format = viz_config.get('export_format', 'html')
             max_modes = min(len(periods), viz_config.get('max_modes', 6))
@@ -256,7 +278,7 @@ class VisualizationHelper:
         Returns:
             True si se creó exitosamente, False en caso contrario
         """
-        if not OPSTOOL_AVAILABLE:
+        if not _ensure_opstool():
             return False
             
         if self._odb is not None:
@@ -284,7 +306,7 @@ class VisualizationHelper:
         Returns:
             True si se generó exitosamente, False en caso contrario
         """
-        if not OPSTOOL_AVAILABLE or self._odb is None:
+        if not _ensure_opstool() or self._odb is None:
             return False
             
         try:
@@ -326,7 +348,7 @@ class VisualizationHelper:
         Returns:
             True si se generó exitosamente, False en caso contrario
         """
-        if not OPSTOOL_AVAILABLE:
+        if not _ensure_opstool():
             return False
             
         try:
@@ -13,7 +13,8 @@ from unittest.mock import patch, MagicMock
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.analysis_engine import AnalysisEngine
+from src import analysis_engine
+from src.analysis_engine import AnalysisEngine, _rect_section_properties, write_json
 
 
 class TestAnalysisEngine(unittest.TestCase):
@@ -26,6 +27,9 @@ class TestAnalysisEngine(unittest.TestCase):
         self.results_dir = os.path.join(self.temp_dir, "results")
         os.makedirs(self.models_dir)
         
+        # El dominio de OpenSees es global: ningún test hereda el de otro
+        analysis_engine._domain_signature = None
+        
         # Crear modelo de prueba
         self.test_model = {
             "name": "test_model",
@@ -110,6 +114,24 @@ class TestAnalysisEngine(unittest.TestCase):
         self.assertIn('elements', loaded_model)
         self.assertIn('analysis_config', loaded_model)
     
+    def test_load_model_from_file_fresh_copies(self):
+        """Test de que cada carga devuelve un modelo propio y refleja el archivo."""
+        engine = AnalysisEngine(self.models_dir, self.results_dir)
+        first = engine.load_model_from_file(self.model_file)
+        second = engine.load_model_from_file(self.model_file)
+        self.assertEqual(first, second)
+        
+        # Modificar un modelo cargado no afecta a las cargas siguientes
+        self.assertIsNot(first, second)
+        first['nodes']['2']['coords'] = [9, 9, 9]
+        self.assertEqual(engine.load_model_from_file(self.model_file), second)
+        
+        # Reescribir el archivo se refleja en la siguiente carga
+        self.test_model['name'] = 'renamed_model'
+        with open(self.model_file, 'w') as f:
+            json.dump(self.test_model, f)
+        self.assertEqual(engine.load_model_from_file(self.model_file)['name'], 'renamed_model')
+    
     def test_load_nonexistent_file(self):
         """Test de manejo de archivos inexistentes."""
         engine = AnalysisEngine(self.models_dir, self.results_dir)
@@ -132,6 +154,357 @@ class TestAnalysisEngine(unittest.TestCase):
         mock_model.assert_called_once_with('basic', '-ndm', 3, '-ndf', 6)
         self.assertEqual(mock_node.call_count, 2)  # 2 nodos
     
+    @patch('src.analysis_engine.ops')
+    def test_build_model_reuses_domain(self, mock_ops):
+        """Test de reutilización del dominio para modelos con la misma estructura."""
+        engine = AnalysisEngine(self.models_dir, self.results_dir)
+        # El dominio vivo tiene los nodos y elementos del modelo construido
+        mock_ops.getNodeTags.return_value = [1, 2]
+        mock_ops.getEleTags.return_value = [1]
+
+        with patch.object(engine, '_section_args', return_value=[]), \
+             patch.object(engine, '_transf_args', return_value=[]), \
+             patch.object(engine, '_apply_loads'):
+            engine.build_model_in_opensees(self.test_model)
+            engine.build_model_in_opensees(self.test_model)
+
+            # La segunda construcción reinicia el dominio en lugar de reconstruirlo
+            mock_ops.wipe.assert_called_once()
+            mock_ops.reset.assert_called_once()
+            self.assertEqual(mock_ops.node.call_count, 2)
+
+            # Un cambio estructural obliga a reconstruir
+            self.test_model['nodes']['2']['coords'] = [0, 0, 4]
+            engine.build_model_in_opensees(self.test_model)
+            self.assertEqual(mock_ops.wipe.call_count, 2)
+            
+            # También se reconstruye si se fuerza
+            engine.build_model_in_opensees(self.test_model, force_rebuild=True)
+            self.assertEqual(mock_ops.wipe.call_count, 3)
+    
+    @patch('src.analysis_engine.ops')
+    def test_build_model_rebuilds_after_external_wipe(self, mock_ops):
+        """Test de reconstrucción si el dominio se limpió fuera del motor."""
+        engine = AnalysisEngine(self.models_dir, self.results_dir)
+        
+        with patch.object(engine, '_section_args', return_value=[]), \
+             patch.object(engine, '_transf_args', return_value=[]), \
+             patch.object(engine, '_apply_loads'):
+            engine.build_model_in_opensees(self.test_model)
+            
+            # ops.wipe() externo: la firma coincide pero el dominio está vacío
+            mock_ops.getNodeTags.return_value = []
+            mock_ops.getEleTags.return_value = []
+            engine.build_model_in_opensees(self.test_model)
+            
+            self.assertEqual(mock_ops.wipe.call_count, 2)
+            mock_ops.reset.assert_not_called()
+    
+    def test_analyze_model_after_external_wipe(self):
+        """Test de regresión: analizar, ops.wipe() y volver a analizar el mismo modelo."""
+        import openseespy.opensees as ops
+        from src.model_builder import ModelBuilder
+        
+        model_info = ModelBuilder(output_dir=self.models_dir).create_model(
+            L_B_ratio=1.0, B=10.0, nx=2, ny=2,
+            analysis_params={'enabled_analyses': ['static', 'modal']})
+        engine = AnalysisEngine(self.models_dir, self.results_dir)
+        
+        first = engine.analyze_model(model_info['file_path'])
+        ops.wipe()
+        second = engine.analyze_model(model_info['file_path'])
+        
+        self.assertTrue(second['static_analysis']['success'])
+        self.assertTrue(second['modal_analysis']['success'])
+        self.assertAlmostEqual(second['modal_analysis']['periods'][0],
+                               first['modal_analysis']['periods'][0])
+    
+    @patch('src.analysis_engine.ops')
+    def test_build_model_domain_shared_between_engines(self, mock_ops):
+        """Test de que la reutilización del dominio considera a todos los motores."""
+        engine_a = AnalysisEngine(self.models_dir, self.results_dir)
+        engine_b = AnalysisEngine(self.models_dir, self.results_dir)
+        other_model = json.loads(json.dumps(self.test_model))
+        other_model['nodes']['2']['coords'] = [0, 0, 4]
+        
+        with patch.object(AnalysisEngine, '_section_args', return_value=[]), \
+             patch.object(AnalysisEngine, '_transf_args', return_value=[]), \
+             patch.object(AnalysisEngine, '_apply_loads'):
+            engine_a.build_model_in_opensees(self.test_model)
+            engine_b.build_model_in_opensees(other_model)
+            
+            # El dominio ahora es el de B: A debe reconstruir el suyo
+            engine_a.build_model_in_opensees(self.test_model)
+            self.assertEqual(mock_ops.wipe.call_count, 3)
+            mock_ops.reset.assert_not_called()
+            
+            # Y B, a su vez, ya no puede reutilizar el que construyó
+            engine_b.build_model_in_opensees(other_model)
+            self.assertEqual(mock_ops.wipe.call_count, 4)
+
+    @patch('src.analysis_engine.ops')
+    def test_build_model_without_reuse_skips_signature(self, mock_ops):
+        """Test de que sin reutilización no se calcula la firma estructural."""
+        engine = AnalysisEngine(self.models_dir, self.results_dir, reuse_domain=False)
+        
+        with patch.object(engine, '_section_args', return_value=[]), \
+             patch.object(engine, '_transf_args', return_value=[]), \
+             patch.object(engine, '_apply_loads'), \
+             patch.object(engine, '_structure_signature') as mock_signature:
+            engine.build_model_in_opensees(self.test_model)
+            engine.build_model_in_opensees(self.test_model)
+            
+            mock_signature.assert_not_called()
+            self.assertEqual(mock_ops.wipe.call_count, 2)
+            self.assertEqual(engine._build_cache, {})
+    
+    def test_build_data_cache(self):
+        """Test de memorización de los datos de construcción por firma."""
+        engine = AnalysisEngine(self.models_dir, self.results_dir)
+        model_hash = engine._structure_signature(self.test_model)
+        section_args = [('Elastic', 2, 1.0, 0.1, 0.001, 0.001, 0.4, 0.002)]
+        
+        with patch.object(engine, '_section_args', return_value=section_args) as mock_sections, \
+             patch.object(engine, '_transf_args', return_value=[]):
+            first = engine._get_build_data(self.test_model, model_hash)
+            second = engine._get_build_data(self.test_model, model_hash)
+            self.assertIs(first, second)
+            self.assertEqual(first['node_args'], [(1, 0, 0, 0), (2, 0, 0, 3)])
+            self.assertEqual(first['base_node_tags'], (1,))
+            self.assertEqual(first['section_args'], section_args)
+            mock_sections.assert_called_once()
+            
+            # Un cambio en los nodos produce otra firma y otros datos
+            self.test_model['nodes']['2']['coords'] = [0, 0, 4]
+            new_hash = engine._structure_signature(self.test_model)
+            self.assertNotEqual(new_hash, model_hash)
+            self.assertEqual(engine._get_build_data(self.test_model, new_hash)['node_args'][1], (2, 0, 0, 4))
+    
+    def test_analyze_model_results_cache(self):
+        """Test de memorización de resultados para modelos idénticos."""
+        # La memorización está desactivada por defecto
+        self.assertFalse(AnalysisEngine(self.models_dir, self.results_dir).cache_results)
+        engine = AnalysisEngine(self.models_dir, self.results_dir, cache_results=True)
+        
+        with patch.object(engine, 'build_model_in_opensees') as mock_build, \
+             patch.object(engine, '_run_analyses', return_value={}), \
+             patch.object(engine, '_build_final_results', side_effect=lambda m, r: {'model_name': m['name']}), \
+             patch.object(engine, '_save_results') as mock_save, \
+             patch.object(engine, '_generate_visualizations'):
+            first = engine.analyze_model(self.model_file)
+            second = engine.analyze_model(self.model_file)
+            mock_build.assert_called_once()
+            
+            # Se devuelve una copia y los resultados se vuelven a guardar
+            self.assertIsNot(first, second)
+            self.assertEqual(second['model_name'], first['model_name'])
+            self.assertEqual(mock_save.call_count, 2)
+            first['model_name'] = 'modificado'
+            self.assertEqual(engine.analyze_model(self.model_file)['model_name'], 'test_model')
+            
+            # Forzar la reconstrucción ignora los resultados memorizados
+            third = engine.analyze_model(self.model_file, force_rebuild=True)
+            self.assertIsNot(third, first)
+            self.assertTrue(mock_build.call_args.kwargs['force_rebuild'])
+            
+            # Sin memorización se vuelve a analizar
+            engine.cache_results = False
+            engine.analyze_model(self.model_file)
+            self.assertEqual(mock_build.call_count, 3)
+    
+    def test_analyze_many_sequential_fallback(self):
+        """Test de análisis múltiple sin pool de procesos."""
+        engine = AnalysisEngine(self.models_dir, self.results_dir)
+        
+        with patch.object(engine, 'analyze_multiple_models', return_value=[{}]) as mock_multiple:
+            self.assertEqual(engine.analyze_many([self.model_file], n_workers=4), [{}])
+            engine.analyze_many([self.model_file, self.model_file], n_workers=1)
+            self.assertEqual(mock_multiple.call_count, 2)
+        
+        # analyze_multiple_models delega en el pool cuando se piden varios procesos
+        with patch.object(engine, 'analyze_many', return_value=[]) as mock_many:
+            engine.analyze_multiple_models([self.model_file], n_workers=4)
+            mock_many.assert_called_once_with([self.model_file], 4, None)
+    
+    def test_batch_results_without_individual_files(self):
+        """Test de guardado agregado cuando no se guardan resultados por modelo."""
+        engine = AnalysisEngine(self.models_dir, self.results_dir, save_individual=False)
+        
+        with patch.object(engine, 'build_model_in_opensees'), \
+             patch.object(engine, '_run_analyses', return_value={}), \
+             patch.object(engine, '_build_final_results', side_effect=lambda m, r: {'model_name': m['name']}), \
+             patch.object(engine, '_generate_visualizations'):
+            results = engine.analyze_multiple_models([self.model_file])
+            engine.analyze_multiple_models([self.model_file], batch_name="estudio")
+            engine.analyze_multiple_models([self.model_file])
+        
+        self.assertEqual(results, [{'model_name': 'test_model'}])
+        self.assertFalse(os.path.exists(os.path.join(self.results_dir, "test_model_results.json")))
+        
+        # Cada lote escribe su propio archivo, con fecha o con el nombre indicado
+        batch_files = sorted(os.listdir(self.results_dir))
+        self.assertEqual(len(batch_files), 3)
+        self.assertIn("estudio_batch_results.json", batch_files)
+        for batch_file in batch_files:
+            self.assertTrue(batch_file.endswith("_batch_results.json"))
+            with open(os.path.join(self.results_dir, batch_file), 'r') as f:
+                self.assertEqual(json.load(f), results)
+    
+    @patch('src.analysis_engine.VisualizationHelper')
+    def test_visualization_helper_deferred(self, mock_helper_class):
+        """Test de creación diferida del helper de visualización."""
+        engine = AnalysisEngine(self.models_dir, self.results_dir)
+        viz_config = self.test_model['analysis_config']['visualization']
+        
+        # Deshabilitada: nunca se crea
+        self.assertIsNone(engine._setup_visualization_helper(self.test_model['analysis_config']))
+        engine._generate_visualizations(self.test_model, {'static_analysis': {'success': True}}, None)
+        mock_helper_class.assert_not_called()
+        
+        # Solo el modelo no deformado: no hace falta durante el análisis
+        viz_config.update({'enabled': True, 'undeformed': True})
+        self.assertIsNone(engine._setup_visualization_helper(self.test_model['analysis_config']))
+        
+        # Y después solo se crea si algún análisis terminó con éxito
+        engine._generate_visualizations(self.test_model, {'static_analysis': {'success': False}}, None)
+        mock_helper_class.assert_not_called()
+        
+        mock_helper_class.return_value.generate_static_visualization.return_value = []
+        mock_helper_class.return_value.generate_undeformed_visualization.return_value = ['undeformed.html']
+        results = {'static_analysis': {'success': True}}
+        engine._generate_visualizations(self.test_model, results, None)
+        mock_helper_class.assert_called_once()
+        self.assertEqual(results['visualization_files'], ['undeformed.html'])
+        
+        # La deformada estática registra respuestas durante el análisis
+        viz_config['static_deformed'] = True
+        self.assertIsNotNone(engine._setup_visualization_helper(self.test_model['analysis_config']))
+    
+    def test_write_json(self):
+        """Test de escritura JSON con orjson y con json como alternativa."""
+        json_file = os.path.join(self.temp_dir, "data.json")
+        
+        for orjson_module in (analysis_engine.orjson, None):
+            with patch('src.analysis_engine.orjson', orjson_module):
+                write_json(json_file, {'a': [1, 2.5], 'b': {'c': None}})
+                with open(json_file, 'r') as f:
+                    self.assertEqual(json.load(f), {'a': [1, 2.5], 'b': {'c': None}})
+                
+                # Sin default, los tipos no nativos fallan igual que con json.dump
+                with self.assertRaises(TypeError):
+                    write_json(json_file, {'a': object()})
+                
+                write_json(json_file, {'a': {1, 2}}, default=sorted)
+                with open(json_file, 'r') as f:
+                    self.assertEqual(json.load(f), {'a': [1, 2]})
+    
+    def test_get_model_files(self):
+        """Test de listado de archivos de modelos."""
+        os.makedirs(os.path.join(self.models_dir, "subdir.json"))
+        with open(os.path.join(self.models_dir, "notes.txt"), 'w') as f:
+            f.write("no es un modelo")
+        
+        engine = AnalysisEngine(self.models_dir, self.results_dir)
+        self.assertEqual(engine.get_model_files(), [self.model_file])
+    
+    @unittest.skipUnless(hasattr(os, 'posix_fadvise'), "posix_fadvise no disponible")
+    def test_prefetch_model_files(self):
+        """Test de lectura anticipada de archivos (los inexistentes se ignoran)."""
+        real_open = os.open
+        opened_fds = []
+        
+        def tracking_open(path, flags):
+            fd = real_open(path, flags)
+            opened_fds.append(fd)
+            return fd
+        
+        with patch('os.open', side_effect=tracking_open) as mock_open, \
+             patch('os.posix_fadvise') as mock_fadvise:
+            AnalysisEngine._prefetch_model_files([self.model_file, "nonexistent.json"])
+        
+        # Se intentan abrir ambos, pero solo se pide WILLNEED para el existente
+        self.assertEqual([c.args[0] for c in mock_open.call_args_list],
+                         [self.model_file, "nonexistent.json"])
+        mock_fadvise.assert_called_once()
+        self.assertEqual(mock_fadvise.call_args.args,
+                         (opened_fds[0], 0, 0, os.POSIX_FADV_WILLNEED))
+        self.assertEqual(len(opened_fds), 1)
+    
+    def test_analyze_in_worker(self):
+        """Test del análisis dentro de un proceso de trabajo."""
+        analysis_engine._init_worker({'models_dir': self.models_dir, 'results_dir': self.results_dir})
+        
+        with patch.object(AnalysisEngine, 'analyze_model', return_value={'model_name': 'test_model'}):
+            self.assertEqual(analysis_engine._analyze_in_worker(self.model_file),
+                             (self.model_file, {'model_name': 'test_model'}, None))
+        
+        with patch.object(AnalysisEngine, 'analyze_model', side_effect=ValueError('fallo')):
+            self.assertEqual(analysis_engine._analyze_in_worker(self.model_file),
+                             (self.model_file, None, 'fallo'))
+    
+    def test_element_args(self):
+        """Test de argumentos de elementos agrupados por tipo."""
+        model = {
+            'sections': {
+                '1': {'type': 'ElasticMembranePlateSection', 'thickness': 0.1},
+                '2': {'type': 'Elastic', 'size': [0.4, 0.4], 'transf_tag': 4}
+            },
+            'elements': {
+                '1': {'type': 'column', 'nodes': ['1', '5'], 'section_tag': 2},
+                '2': {'type': 'slab', 'nodes': [5, 6, 7, 8], 'section_tag': 1}
+            }
+        }
+        slab_args, frame_args = AnalysisEngine._element_args(model)
+        
+        self.assertEqual(slab_args, [(2, 5, 6, 7, 8, 1)])
+        self.assertEqual(frame_args, [(1, 1, 5, 2, 4)])
+    
+    def test_vertical_load_args(self):
+        """Test de preparación de cargas verticales."""
+        model = {
+            'loads': {
+                '5': {'type': 'distributed_load', 'value': -2.5, 'direction': 'Z'},
+                '6': {'type': 'distributed_load', 'value': 1, 'direction': 'X'}
+            }
+        }
+        self.assertEqual(AnalysisEngine._vertical_load_args(model), [(5, -2.5)])
+    
+    def test_base_node_tags_from_model(self):
+        """Test de uso de la lista de nodos de la base guardada en el modelo."""
+        self.assertEqual(AnalysisEngine._base_node_tags(self.test_model), (1,))
+        
+        self.test_model['base_node_tags'] = ['1', 2]
+        self.assertEqual(AnalysisEngine._base_node_tags(self.test_model), (1, 2))
+    
+    def test_rect_section_properties(self):
+        """Test de propiedades de sección rectangular."""
+        A, Iz, Iy, J = _rect_section_properties(0.25, 0.40)
+        
+        self.assertAlmostEqual(A, 0.1)
+        self.assertAlmostEqual(Iz, 0.25 * 0.40**3 / 12)
+        self.assertAlmostEqual(Iy, 0.40 * 0.25**3 / 12)
+        self.assertGreater(J, 0)
+        # Simétrica respecto al intercambio de lados para A y J
+        A2, _, _, J2 = _rect_section_properties(0.40, 0.25)
+        self.assertAlmostEqual(A, A2)
+        self.assertAlmostEqual(J, J2)
+    
+    def test_section_args(self):
+        """Test de argumentos precalculados para ops.section."""
+        model = {
+            'parameters': {'E': 2.0e6, 'nu': 0.25, 'rho': 0.24},
+            'sections': {
+                '1': {'type': 'ElasticMembranePlateSection', 'thickness': 0.1},
+                '2': {'type': 'Elastic', 'size': [0.4, 0.4], 'transf_tag': 4}
+            }
+        }
+        args = AnalysisEngine._section_args(model)
+        
+        self.assertEqual(args[0], ('ElasticMembranePlateSection', 1, 2.0e6, 0.25, 0.1, 0.24))
+        self.assertEqual(args[1][:2], ('Elastic', 2))
+        self.assertAlmostEqual(args[1][6], 2.0e6 / 2.5)  # G
+        self.assertEqual(args[1][3:6], _rect_section_properties(0.4, 0.4)[:3])
+    
     @patch('src.analysis_engine.StaticAnalysis')
     def test_run_static_analysis(self, mock_static_class):
         """Test de ejecución de análisis estático."""
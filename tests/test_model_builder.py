@@ -2,9 +2,19 @@ import unittest
 import os
 import json
 import shutil
+from unittest.mock import patch, MagicMock
 from src.model_builder import ModelBuilder
 import numpy as np
 
+
+def _fake_executor(max_workers, initializer, initargs):
+    """Sustituto de ProcessPoolExecutor: inicializa y ejecuta el map en este proceso."""
+    initializer(*initargs)
+    executor = MagicMock()
+    executor.__enter__.return_value.map.side_effect = map
+    return executor
+
+
 class TestModelBuilder(unittest.TestCase):
     def setUp(self):
         """Configuración inicial para cada test."""
@@ -27,6 +37,16 @@ class TestModelBuilder(unittest.TestCase):
         
         name = self.builder.generate_model_name(L_B_ratio=2.0, B=15.0, nx=6, ny=5)
         self.assertEqual(name, "F01_20_15_0605")
+        
+        # Las relaciones se truncan a un decimal (1.75 -> 17, 1.55 -> 15)
+        name = self.builder.generate_model_name(L_B_ratio=1.75, B=10.0, nx=4, ny=3)
+        self.assertEqual(name, "F01_17_10_0403")
+        name = self.builder.generate_model_name(L_B_ratio=1.55, B=10.0, nx=4, ny=3)
+        self.assertEqual(name, "F01_15_10_0403")
+        
+        # El error de punto flotante no cambia el código
+        name = self.builder.generate_model_name(L_B_ratio=1.0999999999999999, B=10.0, nx=4, ny=3)
+        self.assertEqual(name, "F01_11_10_0403")
     
     def test_dimension_calculation(self):
         """Prueba el cálculo de dimensiones."""
@@ -67,6 +87,102 @@ class TestModelBuilder(unittest.TestCase):
         self.assertTrue(any(e['type'] == 'beam_x' for e in elements.values()))
         self.assertTrue(any(e['type'] == 'beam_y' for e in elements.values()))
     
+    def test_in_memory_output(self):
+        """Prueba la creación de modelos en un diccionario en memoria."""
+        sink = {}
+        builder = ModelBuilder(output_dir=sink)
+        model_info = builder.create_model(L_B_ratio=1.5, B=10.0, nx=4, ny=3)
+
+        self.assertIn(model_info['file_path'], sink)
+        saved = json.loads(sink[model_info['file_path']])
+        self.assertEqual(saved['name'], model_info['name'])
+        self.assertEqual(len(saved['nodes']), len(model_info['nodes']))
+
+    def test_element_connectivity_reused(self):
+        """Prueba que modelos con la misma grilla tienen elementos iguales pero independientes."""
+        first = self.builder.create_model(L_B_ratio=1.5, B=10.0, nx=4, ny=3)
+        second = self.builder.create_model(L_B_ratio=2.0, B=15.0, nx=4, ny=3)
+        
+        self.assertEqual(first['elements'], second['elements'])
+        
+        # Modificar un modelo no debe afectar a los siguientes de la misma grilla
+        first['elements'][1]['section_tag'] = 99
+        third = self.builder.create_model(L_B_ratio=1.5, B=10.0, nx=4, ny=3)
+        self.assertEqual(second['elements'][1]['section_tag'], 1)
+        self.assertEqual(third['elements'][1]['section_tag'], 1)
+        with open(third['file_path'], 'r') as f:
+            self.assertEqual(json.load(f)['elements']['1']['section_tag'], 1)
+    
+    def test_section_definitions_reused(self):
+        """Prueba que modelos con las mismas dimensiones tienen secciones iguales pero independientes."""
+        first = self.builder.create_model(L_B_ratio=1.5, B=10.0, nx=4, ny=3)
+        second = self.builder.create_model(L_B_ratio=2.0, B=15.0, nx=5, ny=4)
+        
+        self.assertEqual(first['sections'], second['sections'])
+        self.assertEqual(first['transformations'], second['transformations'])
+        self.assertEqual(first['sections']['2']['size'], (0.40, 0.40))
+        
+        # Modificar un modelo no debe afectar a los siguientes
+        first['sections']['2']['size'] = (0.50, 0.50)
+        first['transformations']['4']['type'] = 'PDelta'
+        third = self.builder.create_model(L_B_ratio=1.5, B=10.0, nx=4, ny=3)
+        self.assertEqual(third['sections']['2']['size'], (0.40, 0.40))
+        self.assertEqual(third['transformations']['4']['type'], 'Linear')
+        with open(third['file_path'], 'r') as f:
+            self.assertEqual(json.load(f)['sections']['2']['size'], [0.40, 0.40])
+        
+        self.builder.fixed_params['beam_size'] = (0.30, 0.50)
+        fourth = self.builder.create_model(L_B_ratio=1.5, B=10.0, nx=4, ny=3)
+        self.assertEqual(fourth['sections']['3']['size'], (0.30, 0.50))
+    
+    @patch('src.model_builder.ProcessPoolExecutor')
+    def test_create_many(self, mock_executor_class):
+        """Prueba la creación de varios modelos en paralelo (pool simulado)."""
+        mock_executor_class.side_effect = _fake_executor
+        
+        param_grid = [
+            {'L_B_ratio': 1.0, 'B': 10.0, 'nx': 3, 'ny': 3},
+            {'L_B_ratio': 1.5, 'B': 10.0, 'nx': 4, 'ny': 3},
+        ]
+        models = self.builder.create_many(param_grid, n_workers=4)
+        
+        # No se crean más procesos que modelos
+        self.assertEqual(mock_executor_class.call_args.kwargs['max_workers'], 2)
+        self.assertEqual([m['name'] for m in models], ["F01_10_10_0303", "F01_15_10_0403"])
+        for model in models:
+            self.assertTrue(os.path.exists(model['file_path']))
+    
+    @patch('src.model_builder.ProcessPoolExecutor')
+    def test_create_many_logs_errors(self, mock_executor_class):
+        """Prueba que los modelos que fallan se registran y se omiten."""
+        mock_executor_class.side_effect = _fake_executor
+        
+        param_grid = [{'L_B_ratio': 1.0, 'B': 10.0, 'nx': 3, 'ny': 3}, {'L_B_ratio': 1.5}]
+        with self.assertLogs('src.model_builder', level='ERROR') as logs:
+            models = self.builder.create_many(param_grid, n_workers=2)
+        
+        self.assertEqual([m['name'] for m in models], ["F01_10_10_0303"])
+        self.assertEqual(len(logs.records), 1)
+    
+    @patch('src.model_builder.ProcessPoolExecutor')
+    def test_create_many_single_worker(self, mock_executor_class):
+        """Prueba que con un solo proceso los modelos se crean secuencialmente."""
+        models = self.builder.create_many([{'L_B_ratio': 1.0, 'B': 10.0, 'nx': 3, 'ny': 3},
+                                           {'L_B_ratio': 1.5, 'B': 10.0, 'nx': 4, 'ny': 3}],
+                                          n_workers=1)
+        
+        mock_executor_class.assert_not_called()
+        self.assertEqual([m['name'] for m in models], ["F01_10_10_0303", "F01_15_10_0403"])
+    
+    def test_create_many_in_memory(self):
+        """Prueba que la salida en memoria crea los modelos secuencialmente."""
+        sink = {}
+        builder = ModelBuilder(output_dir=sink)
+        models = builder.create_many([{'L_B_ratio': 1.0, 'B': 10.0, 'nx': 3, 'ny': 3},
+                                      {'L_B_ratio': 1.5, 'B': 10.0, 'nx': 4, 'ny': 3}])
+        
+        self.assertEqual(sorted(sink), sorted(m['file_path'] for m in models))
+    
     def test_model_export_to_python(self):
         """Prueba la exportación del modelo a Python."""
         # Crear modelo JSON primero
@@ -131,6 +247,12 @@ class TestModelBuilder(unittest.TestCase):
         self.assertTrue(0 < params['nu'] < 0.5)
         self.assertGreater(params['rho'], 0)
     
+    def test_base_node_tags(self):
+        """Prueba que la lista de nodos de la base coincide con los nodos del piso 0."""
+        model_info = self.builder.create_model(L_B_ratio=1.0, B=10.0, nx=3, ny=2)
+        expected = [tag for tag, info in model_info['nodes'].items() if info['floor'] == 0]
+        self.assertEqual(model_info['base_node_tags'], expected)
+    
     def test_boundary_conditions(self):
         """Prueba que las condiciones de frontera estén correctamente aplicadas."""
         model_info = self.builder.create_model(L_B_ratio=1.0, B=10.0, nx=3, ny=3)
@@ -14,7 +14,7 @@ import pandas as pd
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.parametric_runner import ParametricRunner
+from src.parametric_runner import ParametricRunner, ModelParams
 from src.model_builder import ModelBuilder
 from src.analysis_engine import AnalysisEngine
 from src.report_generator import ReportGenerator
@@ -133,6 +133,26 @@ class TestParametricRunner(unittest.TestCase):
         self.assertEqual(combinations[0]['L_B_ratio'], 2.0)
         self.assertEqual(combinations[0]['B'], 10.0)
     
+    def test_combinations_as_model_params(self):
+        """Test de combinaciones geométricas como ModelParams hashables."""
+        combinations = ParametricRunner._combinations([1.5, 2.0], [10.0], [3], [3, 4])
+        
+        self.assertEqual(len(combinations), 4)
+        self.assertEqual(combinations[0], ModelParams(1.5, 10.0, 3, 3))
+        self.assertEqual(combinations[0]._asdict()['L_B_ratio'], 1.5)
+        self.assertEqual(len(set(combinations)), 4)
+    
+    def test_create_model_by_type(self):
+        """Test de selección del helper según el tipo de análisis."""
+        self.runner.helpers = MagicMock()
+        
+        self.runner._create_model_by_type('modal', 1.5, 10.0, 3, 3)
+        self.runner.helpers.create_modal_only_model.assert_called_once_with(1.5, 10.0, 3, 3)
+        
+        # Tipos desconocidos se crean como análisis completo
+        self.runner._create_model_by_type('other', 1.5, 10.0, 3, 3)
+        self.runner.helpers.create_complete_model.assert_called_once_with(1.5, 10.0, 3, 3)
+    
     def test_create_model_name(self):
         """Test de creación de nombres de modelos."""
         params = {'L_B_ratio': 1.5, 'B': 8.0, 'nx': 2, 'ny': 3}
@@ -7,6 +7,7 @@ import unittest
 import tempfile
 import os
 import shutil
+import subprocess
 from unittest.mock import patch, MagicMock
 
 import sys
@@ -318,6 +319,16 @@ class TestGlobalConvenienceFunctions(unittest.TestCase):
         # Verificar que se usó el directorio por defecto
         mock_model_builder_class.assert_called_once_with(output_dir="models")
 
+    
+    def test_notebook_style_import(self):
+        """Test de la importación documentada en los notebooks (src/ en sys.path)."""
+        src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
+        code = ("import sys; sys.path.append(sys.argv[1]); "
+                "from utils.model_helpers import ModelBuilderHelpers")
+        result = subprocess.run([sys.executable, '-c', code, src_dir],
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
 
 if __name__ == '__main__':
     unittest.main()